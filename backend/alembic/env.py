@@ -5,18 +5,13 @@ from logging.config import fileConfig
 
 from alembic import context
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 
+# orm_registry registers every module's ORM models on Base.metadata for autogenerate.
+import talent_inbound.orm_registry  # noqa: F401
 from talent_inbound.config import get_settings
 from talent_inbound.shared.infrastructure.database import Base
 
-# Import all ORM models so Alembic can detect them for autogenerate.
-# Add new model imports here as modules are implemented.
-from talent_inbound.modules.auth.infrastructure.orm_models import *  # noqa: F401,F403
-from talent_inbound.modules.profile.infrastructure.orm_models import *  # noqa: F401,F403
-# from talent_inbound.modules.ingestion.infrastructure.orm_models import *  # noqa
-# from talent_inbound.modules.opportunities.infrastructure.orm_models import *  # noqa
-# from talent_inbound.modules.chat.infrastructure.orm_models import *  # noqa
-
 config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -45,8 +40,12 @@ def do_run_migrations(connection) -> None:
 
 
 async def run_migrations_online() -> None:
-    """Run migrations in 'online' mode (connects to DB asynchronously)."""
-    connectable = create_async_engine(settings.database_url)
+    """Run migrations in 'online' mode (connects to DB asynchronously).
+
+    NullPool: migrations use a single connection once, so a pool only adds
+    setup cost and leaves nothing worth reusing.
+    """
+    connectable = create_async_engine(settings.database_url, poolclass=NullPool)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
@@ -23,16 +23,17 @@ def upgrade() -> None:
         sa.Column('id', sa.String(length=36), nullable=False),
         sa.Column('candidate_id', sa.String(length=36), nullable=False),
         sa.Column('opportunity_id', sa.String(length=36), nullable=True),
-        sa.Column('raw_content', sa.Text(), nullable=False),
-        sa.Column('sanitized_content', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
         sa.Column('source', sa.String(length=30), nullable=False),
         sa.Column('interaction_type', sa.String(length=20), nullable=False, server_default='INITIAL'),
         sa.Column('processing_status', sa.String(length=20), nullable=False, server_default='PENDING'),
         sa.Column('classification', sa.String(length=20), nullable=True),
         sa.Column('content_hash', sa.String(length=64), nullable=False),
+        # Large TOASTable payloads last, after the fixed-width and short columns
+        sa.Column('raw_content', sa.Text(), nullable=False),
+        sa.Column('sanitized_content', sa.Text(), nullable=True),
         sa.Column('pipeline_log', postgresql.JSONB(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
         sa.ForeignKeyConstraint(['candidate_id'], ['users.id'], ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['opportunity_id'], ['opportunities.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
@@ -0,0 +1,70 @@
+"""Replace single-column interaction indexes with a (candidate_id, content_hash) one.
+
+The exact-duplicate check filters on candidate_id AND content_hash and
+reads only opportunity_id. A composite index carrying opportunity_id as an
+INCLUDE column answers it with an index-only scan. candidate_id is its
+leading column, so it also serves the candidate-scoped interaction lookups
+and the users ON DELETE CASCADE; the separate candidate_id and
+content_hash indexes become redundant and are dropped.
+
+Indexes are built and dropped CONCURRENTLY inside an autocommit block, so
+the table keeps accepting writes while they build. If a concurrent build
+fails it leaves an INVALID index, which must be dropped before re-running.
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2026-02-26
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c0d1e2f3a4b5"
+down_revision = "b9c0d1e2f3a4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_interactions_candidate_hash",
+            "interactions",
+            ["candidate_id", "content_hash"],
+            postgresql_include=["opportunity_id"],
+            postgresql_concurrently=True,
+        )
+
+        op.drop_index(
+            "ix_interactions_content_hash",
+            table_name="interactions",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_interactions_candidate_id",
+            table_name="interactions",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_interactions_candidate_id",
+            "interactions",
+            ["candidate_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_interactions_content_hash",
+            "interactions",
+            ["content_hash"],
+            postgresql_concurrently=True,
+        )
+
+        op.drop_index(
+            "ix_interactions_candidate_hash",
+            table_name="interactions",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,88 @@
+"""Replace single-column opportunity indexes with candidate-scoped ones.
+
+Every opportunity query filters on candidate_id first. The stale query
+also filters non-archived rows and orders by last_interaction_at, so a
+partial (candidate_id, last_interaction_at DESC) index serves it without
+reading archived entries. Stage filters get a (candidate_id, stage) index
+covering every stage, terminal ones included.
+
+No INCLUDE columns: the repositories load full OpportunityModel rows, so
+index-only scans are not possible and extra payload would only grow the
+index.
+
+Indexes are built and dropped CONCURRENTLY inside an autocommit block, so
+the table keeps accepting writes while they build. The new indexes are
+built before the old ones are dropped, so queries are always served by one.
+If a concurrent build fails it leaves an INVALID index, which must be
+dropped before re-running.
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-02-24
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d5e6f7a8b9c0"
+down_revision = "c4d5e6f7a8b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_opportunities_candidate_last_interaction",
+            "opportunities",
+            ["candidate_id", sa.text("last_interaction_at DESC")],
+            postgresql_where=sa.text("is_archived = false"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_opportunities_candidate_stage",
+            "opportunities",
+            ["candidate_id", "stage"],
+            postgresql_concurrently=True,
+        )
+
+        # ix_opportunities_status was created before the status → stage rename
+        op.drop_index(
+            "ix_opportunities_status",
+            table_name="opportunities",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_opportunities_last_interaction_at",
+            table_name="opportunities",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_opportunities_last_interaction_at",
+            "opportunities",
+            ["last_interaction_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_opportunities_status",
+            "opportunities",
+            ["stage"],
+            postgresql_concurrently=True,
+        )
+
+        op.drop_index(
+            "ix_opportunities_candidate_stage",
+            table_name="opportunities",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_opportunities_candidate_last_interaction",
+            table_name="opportunities",
+            postgresql_concurrently=True,
+        )
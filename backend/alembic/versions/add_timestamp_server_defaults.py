@@ -0,0 +1,63 @@
+"""Let PostgreSQL fill created_at / updated_at.
+
+created_at and updated_at default to now() on every table, and a shared
+set_updated_at() BEFORE UPDATE trigger stamps updated_at on each row
+change. The ORM no longer computes either timestamp; updated_at is read
+back through RETURNING after each flush.
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-02-25
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b9c0d1e2f3a4"
+down_revision = "a8b9c0d1e2f3"
+branch_labels = None
+depends_on = None
+
+_TABLES = (
+    "users",
+    "candidate_profiles",
+    "opportunities",
+    "stage_transitions",
+    "interactions",
+    "draft_responses",
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in _TABLES:
+        op.execute(
+            f"ALTER TABLE {table} "
+            "ALTER COLUMN created_at SET DEFAULT now(), "
+            "ALTER COLUMN updated_at SET DEFAULT now()"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER {table}_set_updated_at ON {table}")
+        op.execute(
+            f"ALTER TABLE {table} "
+            "ALTER COLUMN created_at DROP DEFAULT, "
+            "ALTER COLUMN updated_at DROP DEFAULT"
+        )
+    op.execute("DROP FUNCTION set_updated_at()")
@@ -0,0 +1,114 @@
+"""Convert id and foreign-key columns from VARCHAR(36) to native uuid.
+
+Native uuid is 16 bytes instead of 37, so primary-key and FK indexes get
+denser and comparisons are fixed-width. Each table is rewritten once by a
+single ALTER TABLE carrying all of its column changes. Foreign keys are
+dropped first (PostgreSQL cannot keep a constraint across the type change)
+and recreated afterwards with their original names and ON DELETE rules.
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-02-25
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6f7a8b9c0d1"
+down_revision = "d5e6f7a8b9c0"
+branch_labels = None
+depends_on = None
+
+# Tables and their identifier columns, referenced tables first.
+_ID_COLUMNS: dict[str, list[str]] = {
+    "users": ["id"],
+    "candidate_profiles": ["id", "candidate_id"],
+    "opportunities": ["id", "candidate_id"],
+    "stage_transitions": ["id", "opportunity_id"],
+    "interactions": ["id", "candidate_id", "opportunity_id"],
+    "draft_responses": ["id", "opportunity_id"],
+}
+
+
+# Foreign keys on the affected tables, as PostgreSQL auto-named them when the
+# tables were created (the stage_transitions rename kept the old name).
+# Hardcoded rather than inspected so the migration renders with --sql.
+# (table, constraint name, referred table, columns, ON DELETE)
+_FOREIGN_KEYS: list[tuple[str, str, str, list[str], str]] = [
+    (
+        "opportunities",
+        "opportunities_candidate_id_fkey",
+        "users",
+        ["candidate_id"],
+        "CASCADE",
+    ),
+    (
+        "stage_transitions",
+        "status_transitions_opportunity_id_fkey",
+        "opportunities",
+        ["opportunity_id"],
+        "CASCADE",
+    ),
+    (
+        "interactions",
+        "interactions_candidate_id_fkey",
+        "users",
+        ["candidate_id"],
+        "CASCADE",
+    ),
+    (
+        "interactions",
+        "interactions_opportunity_id_fkey",
+        "opportunities",
+        ["opportunity_id"],
+        "SET NULL",
+    ),
+    (
+        "draft_responses",
+        "draft_responses_opportunity_id_fkey",
+        "opportunities",
+        ["opportunity_id"],
+        "CASCADE",
+    ),
+    (
+        "candidate_profiles",
+        "candidate_profiles_candidate_id_fkey",
+        "users",
+        ["candidate_id"],
+        "CASCADE",
+    ),
+]
+
+
+def _drop_foreign_keys() -> None:
+    for table, name, _, _, _ in _FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+
+
+def _create_foreign_keys() -> None:
+    for table, name, referred_table, columns, ondelete in _FOREIGN_KEYS:
+        op.create_foreign_key(
+            name, table, referred_table, columns, ["id"], ondelete=ondelete
+        )
+
+
+def _alter_id_columns(target_type: str) -> None:
+    for table, columns in _ID_COLUMNS.items():
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} TYPE {target_type} USING {column}::{target_type}"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def upgrade() -> None:
+    _drop_foreign_keys()
+    _alter_id_columns("uuid")
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    _drop_foreign_keys()
+    _alter_id_columns("varchar(36)")
+    _create_foreign_keys()
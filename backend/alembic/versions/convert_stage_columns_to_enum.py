@@ -0,0 +1,61 @@
+"""Store opportunity stage columns as a native opportunity_stage enum.
+
+opportunities.stage/suggested_stage and stage_transitions.from_stage/
+to_stage hold one of eight values; as an enum each takes 4 bytes instead
+of a variable-length string, which shrinks ix_opportunities_candidate_stage.
+The stale server default 'NEW' (left over from the status → stage rename)
+is replaced by 'DISCOVERY', since 'NEW' is not a member of the enum.
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-02-25
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a8b9c0d1e2f3"
+down_revision = "f7a8b9c0d1e2"
+branch_labels = None
+depends_on = None
+
+_STAGES = (
+    "DISCOVERY",
+    "ENGAGING",
+    "INTERVIEWING",
+    "NEGOTIATING",
+    "OFFER",
+    "REJECTED",
+    "DECLINED",
+    "GHOSTED",
+)
+
+_STAGE_COLUMNS: dict[str, list[str]] = {
+    "opportunities": ["stage", "suggested_stage"],
+    "stage_transitions": ["from_stage", "to_stage"],
+}
+
+
+def _alter_stage_columns(target_type: str) -> None:
+    for table, columns in _STAGE_COLUMNS.items():
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} TYPE {target_type} USING {column}::{target_type}"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def upgrade() -> None:
+    labels = ", ".join(f"'{stage}'" for stage in _STAGES)
+    op.execute(f"CREATE TYPE opportunity_stage AS ENUM ({labels})")
+    op.execute("ALTER TABLE opportunities ALTER COLUMN stage DROP DEFAULT")
+    _alter_stage_columns("opportunity_stage")
+    op.execute("ALTER TABLE opportunities ALTER COLUMN stage SET DEFAULT 'DISCOVERY'")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE opportunities ALTER COLUMN stage DROP DEFAULT")
+    _alter_stage_columns("varchar(30)")
+    op.execute("ALTER TABLE opportunities ALTER COLUMN stage SET DEFAULT 'NEW'")
+    op.execute("DROP TYPE opportunity_stage")
@@ -8,7 +8,6 @@ Create Date: 2026-02-16 10:00:00.000000
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = 'b3c4d5e6f7a8'
@@ -21,91 +20,87 @@ def upgrade() -> None:
     # 1. Rename column: opportunities.status → opportunities.stage
     op.alter_column('opportunities', 'status', new_column_name='stage')
 
-    # 2. Migrate existing status values to new stage values
-    op.execute(
-        "UPDATE opportunities SET stage = 'DISCOVERY' "
-        "WHERE stage IN ('NEW', 'ANALYZING', 'ACTION_REQUIRED')"
-    )
+    # 2. Migrate existing status values to new stage values (single pass,
+    #    joined against an inline old → new mapping)
+    # INTERVIEWING, OFFER, REJECTED, GHOSTED remain the same
     op.execute(
-        "UPDATE opportunities SET stage = 'ENGAGING' "
-        "WHERE stage = 'REVIEWING'"
+        "UPDATE opportunities AS o SET stage = m.new_stage "
+        "FROM (VALUES ('NEW', 'DISCOVERY'), ('ANALYZING', 'DISCOVERY'), "
+        "('ACTION_REQUIRED', 'DISCOVERY'), ('REVIEWING', 'ENGAGING')) "
+        "AS m(old_stage, new_stage) "
+        "WHERE o.stage = m.old_stage"
     )
-    # INTERVIEWING, OFFER, REJECTED, GHOSTED remain the same
 
-    # 3. Add new columns for stage suggestions
-    op.add_column(
-        'opportunities',
-        sa.Column('suggested_stage', sa.String(30), nullable=True),
-    )
-    op.add_column(
-        'opportunities',
-        sa.Column('suggested_stage_reason', sa.Text(), nullable=True),
+    # 3. Add new columns for stage suggestions (one ALTER TABLE; RENAME
+    #    COLUMN above cannot share a statement with other subcommands)
+    op.execute(
+        "ALTER TABLE opportunities "
+        "ADD COLUMN suggested_stage VARCHAR(30), "
+        "ADD COLUMN suggested_stage_reason TEXT"
     )
 
     # 4. Rename status_transitions table → stage_transitions
     op.rename_table('status_transitions', 'stage_transitions')
 
-    # 5. Rename columns in stage_transitions
-    op.alter_column('stage_transitions', 'from_status', new_column_name='from_stage')
-    op.alter_column('stage_transitions', 'to_status', new_column_name='to_stage')
+    # 5. Rename columns in stage_transitions (grouped; PostgreSQL still runs
+    #    one RENAME COLUMN per column)
+    with op.batch_alter_table('stage_transitions') as batch_op:
+        batch_op.alter_column('from_status', new_column_name='from_stage')
+        batch_op.alter_column('to_status', new_column_name='to_stage')
 
-    # 6. Migrate transition data to new stage values
-    op.execute(
-        "UPDATE stage_transitions SET from_stage = 'DISCOVERY' "
-        "WHERE from_stage IN ('NEW', 'ANALYZING', 'ACTION_REQUIRED')"
-    )
-    op.execute(
-        "UPDATE stage_transitions SET from_stage = 'ENGAGING' "
-        "WHERE from_stage = 'REVIEWING'"
-    )
+    # 6. Migrate transition data to new stage values (single pass, both columns)
     op.execute(
-        "UPDATE stage_transitions SET to_stage = 'DISCOVERY' "
-        "WHERE to_stage IN ('NEW', 'ANALYZING', 'ACTION_REQUIRED')"
-    )
-    op.execute(
-        "UPDATE stage_transitions SET to_stage = 'ENGAGING' "
-        "WHERE to_stage = 'REVIEWING'"
+        "UPDATE stage_transitions SET "
+        "from_stage = CASE "
+        "WHEN from_stage IN ('NEW', 'ANALYZING', 'ACTION_REQUIRED') THEN 'DISCOVERY' "
+        "WHEN from_stage = 'REVIEWING' THEN 'ENGAGING' "
+        "ELSE from_stage END, "
+        "to_stage = CASE "
+        "WHEN to_stage IN ('NEW', 'ANALYZING', 'ACTION_REQUIRED') THEN 'DISCOVERY' "
+        "WHEN to_stage = 'REVIEWING' THEN 'ENGAGING' "
+        "ELSE to_stage END "
+        "WHERE from_stage IN ('NEW', 'ANALYZING', 'ACTION_REQUIRED', 'REVIEWING') "
+        "OR to_stage IN ('NEW', 'ANALYZING', 'ACTION_REQUIRED', 'REVIEWING')"
     )
 
 
 def downgrade() -> None:
-    # Reverse migration data in stage_transitions
-    op.execute(
-        "UPDATE stage_transitions SET from_stage = 'ACTION_REQUIRED' "
-        "WHERE from_stage = 'DISCOVERY'"
-    )
-    op.execute(
-        "UPDATE stage_transitions SET from_stage = 'REVIEWING' "
-        "WHERE from_stage = 'ENGAGING'"
-    )
-    op.execute(
-        "UPDATE stage_transitions SET to_stage = 'ACTION_REQUIRED' "
-        "WHERE to_stage = 'DISCOVERY'"
-    )
+    # Reverse migration data in stage_transitions (single pass, both columns)
     op.execute(
-        "UPDATE stage_transitions SET to_stage = 'REVIEWING' "
-        "WHERE to_stage = 'ENGAGING'"
+        "UPDATE stage_transitions SET "
+        "from_stage = CASE from_stage "
+        "WHEN 'DISCOVERY' THEN 'ACTION_REQUIRED' "
+        "WHEN 'ENGAGING' THEN 'REVIEWING' "
+        "ELSE from_stage END, "
+        "to_stage = CASE to_stage "
+        "WHEN 'DISCOVERY' THEN 'ACTION_REQUIRED' "
+        "WHEN 'ENGAGING' THEN 'REVIEWING' "
+        "ELSE to_stage END "
+        "WHERE from_stage IN ('DISCOVERY', 'ENGAGING') "
+        "OR to_stage IN ('DISCOVERY', 'ENGAGING')"
     )
 
-    # Rename columns back
-    op.alter_column('stage_transitions', 'from_stage', new_column_name='from_status')
-    op.alter_column('stage_transitions', 'to_stage', new_column_name='to_status')
+    # Rename columns back (grouped; one RENAME COLUMN per column)
+    with op.batch_alter_table('stage_transitions') as batch_op:
+        batch_op.alter_column('from_stage', new_column_name='from_status')
+        batch_op.alter_column('to_stage', new_column_name='to_status')
 
     # Rename table back
     op.rename_table('stage_transitions', 'status_transitions')
 
     # Drop new columns
-    op.drop_column('opportunities', 'suggested_stage_reason')
-    op.drop_column('opportunities', 'suggested_stage')
-
-    # Reverse data migration
     op.execute(
-        "UPDATE opportunities SET stage = 'ACTION_REQUIRED' "
-        "WHERE stage = 'DISCOVERY'"
+        "ALTER TABLE opportunities "
+        "DROP COLUMN suggested_stage_reason, "
+        "DROP COLUMN suggested_stage"
     )
+
+    # Reverse data migration (single pass, joined against the mapping)
     op.execute(
-        "UPDATE opportunities SET stage = 'REVIEWING' "
-        "WHERE stage = 'ENGAGING'"
+        "UPDATE opportunities AS o SET stage = m.old_stage "
+        "FROM (VALUES ('DISCOVERY', 'ACTION_REQUIRED'), ('ENGAGING', 'REVIEWING')) "
+        "AS m(new_stage, old_stage) "
+        "WHERE o.stage = m.new_stage"
     )
 
     # Rename column back
@@ -0,0 +1,34 @@
+"""Store interactions.content_hash as a raw 32-byte SHA-256 digest.
+
+The hex string took 64 bytes per row (plus its index entry); the raw
+digest takes 32, so the duplicate-detection index is half the size.
+Existing values are hex-decoded in place and the index is rebuilt by
+PostgreSQL as part of the type change.
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-02-25
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f7a8b9c0d1e2"
+down_revision = "e6f7a8b9c0d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE interactions ALTER COLUMN content_hash "
+        "TYPE bytea USING decode(content_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE interactions ALTER COLUMN content_hash "
+        "TYPE varchar(64) USING encode(content_hash, 'hex')"
+    )
@@ -14,7 +14,7 @@ from talent_inbound.modules.pipeline.presentation.router import (
 )
 from talent_inbound.modules.profile.presentation.router import router as profile_router
 
-v1_router = APIRouter()
+v1_router = APIRouter(prefix="/api/v1")
 
 v1_router.include_router(auth_router)
 v1_router.include_router(profile_router)
@@ -8,24 +8,19 @@ import argparse
 import asyncio
 import sys
 
-from sqlalchemy import select, update
+from sqlalchemy import update
 
-from talent_inbound.config import get_settings
+from talent_inbound.container import get_container
 from talent_inbound.modules.auth.infrastructure.orm_models import UserModel
-from talent_inbound.modules.auth.infrastructure.password import BcryptPasswordHasher
-from talent_inbound.shared.infrastructure.database import (
-    create_engine,
-    create_session_factory,
-)
 
 
 async def reset_password(email: str) -> None:
     """Reset a user's password by email. Prompts for the new password."""
     import getpass
 
-    settings = get_settings()
-    engine = create_engine(settings.database_url, echo=False)
-    session_factory = create_session_factory(engine)
+    container = get_container()
+    engine = container.db_engine()
+    session_factory = container.db_session_factory()
 
     new_password = getpass.getpass("New password: ")
     confirm = getpass.getpass("Confirm password: ")
@@ -38,26 +33,19 @@ async def reset_password(email: str) -> None:
         print("Error: Password must be at least 8 characters.")
         sys.exit(1)
 
-    hasher = BcryptPasswordHasher()
-    hashed = hasher.hash(new_password)
+    hashed = container.password_hasher().hash(new_password)
 
     async with session_factory() as session:
-        # Check user exists
+        # Single round-trip: update by email, RETURNING tells us if it matched
         result = await session.execute(
-            select(UserModel).where(UserModel.email == email)
-        )
-        user = result.scalar_one_or_none()
-
-        if user is None:
-            print(f"Error: No user found with email '{email}'.")
-            sys.exit(1)
-
-        # Update password
-        await session.execute(
             update(UserModel)
-            .where(UserModel.id == user.id)
+            .where(UserModel.email == email)
             .values(hashed_password=hashed)
+            .returning(UserModel.id)
         )
+        if result.scalar_one_or_none() is None:
+            print(f"Error: No user found with email '{email}'.")
+            sys.exit(1)
         await session.commit()
 
     await engine.dispose()
@@ -1,8 +1,11 @@
 """Dependency injection container using dependency-injector."""
 
+from functools import lru_cache
+from operator import attrgetter
+
 from dependency_injector import containers, providers
 
-from talent_inbound.config import Settings
+from talent_inbound.config import get_settings
 from talent_inbound.modules.auth.application.get_current_user import GetCurrentUser
 from talent_inbound.modules.auth.application.login_user import LoginUser
 from talent_inbound.modules.auth.application.register_user import RegisterUser
@@ -10,6 +13,7 @@ from talent_inbound.modules.auth.infrastructure.password import BcryptPasswordHa
 from talent_inbound.modules.auth.infrastructure.repositories import (
     SqlAlchemyUserRepository,
 )
+from talent_inbound.modules.auth.infrastructure.token_cache import AccessTokenCache
 from talent_inbound.modules.ingestion.application.submit_message import SubmitMessage
 from talent_inbound.modules.ingestion.infrastructure.repositories import (
     SqlAlchemyInteractionRepository,
@@ -68,13 +72,20 @@ class Container(containers.DeclarativeContainer):
         ]
     )
 
-    config = providers.Singleton(Settings)
+    # Same instance as get_settings() elsewhere — env is parsed once per process.
+    config = providers.Singleton(get_settings)
 
     # Shared infrastructure
     db_engine = providers.Singleton(
         create_engine,
         database_url=config.provided.database_url,
         echo=False,
+        pool_size=config.provided.db_pool_size,
+        max_overflow=config.provided.db_max_overflow,
+        pool_recycle=config.provided.db_pool_recycle,
+        pool_pre_ping=config.provided.db_pool_pre_ping,
+        pool_use_lifo=config.provided.db_pool_use_lifo,
+        query_cache_size=config.provided.db_query_cache_size,
     )
 
     db_session_factory = providers.Singleton(
@@ -87,7 +98,14 @@ class Container(containers.DeclarativeContainer):
     event_bus = providers.Singleton(InProcessEventBus)
 
     # --- Auth module ---
-    password_hasher = providers.Singleton(BcryptPasswordHasher)
+    # Resolved once: Settings never change at runtime, and the auth use cases
+    # are built on every request (config.provided re-reads the attribute each time).
+    jwt_secret_key = providers.Singleton(attrgetter("jwt_secret_key"), config)
+
+    password_hasher = providers.Singleton(
+        BcryptPasswordHasher,
+        rounds=config.provided.bcrypt_rounds,
+    )
 
     user_repo = providers.Factory(
         SqlAlchemyUserRepository,
@@ -105,15 +123,18 @@ class Container(containers.DeclarativeContainer):
         LoginUser,
         user_repo=user_repo,
         password_hasher=password_hasher,
-        jwt_secret=config.provided.jwt_secret_key,
+        jwt_secret=jwt_secret_key,
         access_token_expire_minutes=config.provided.jwt_access_token_expire_minutes,
         refresh_token_expire_days=config.provided.jwt_refresh_token_expire_days,
     )
 
+    access_token_cache = providers.Singleton(AccessTokenCache)
+
     get_current_user_uc = providers.Factory(
         GetCurrentUser,
         user_repo=user_repo,
-        jwt_secret=config.provided.jwt_secret_key,
+        jwt_secret=jwt_secret_key,
+        token_cache=access_token_cache,
     )
 
     # --- Profile module ---
@@ -221,3 +242,9 @@ class Container(containers.DeclarativeContainer):
         profile_repo=profile_repo,
         model_router=model_router,
     )
+
+
+@lru_cache(maxsize=1)
+def get_container() -> Container:
+    """Process-wide container: wiring and providers are set up once."""
+    return Container()
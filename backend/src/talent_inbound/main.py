@@ -6,7 +6,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.exc import OperationalError
 
 from talent_inbound.config import get_settings
-from talent_inbound.container import Container
+from talent_inbound.container import get_container
 from talent_inbound.shared.infrastructure.database import DBSessionMiddleware
 from talent_inbound.shared.infrastructure.logging import configure_logging, get_logger
 from talent_inbound.shared.infrastructure.middleware import RequestLoggingMiddleware
@@ -31,7 +31,7 @@ def create_app() -> FastAPI:
     )
 
     # DI container
-    container = Container()
+    container = get_container()
     app.container = container  # type: ignore[attr-defined]
 
     # CORS — configurable via CORS_ORIGINS env var (comma-separated)
@@ -54,7 +54,7 @@ def create_app() -> FastAPI:
     # API routes (must be registered on FastAPI app BEFORE ASGI wrapping)
     from talent_inbound.api.v1.router import v1_router
 
-    app.include_router(v1_router, prefix="/api/v1")
+    app.include_router(v1_router)
 
     # Global handler: database connection errors → 503
     async def _db_unavailable_response(
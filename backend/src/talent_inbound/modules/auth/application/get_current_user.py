@@ -1,10 +1,11 @@
 """GetCurrentUser use case — validates a JWT and returns the user."""
 
-from jose import JWTError, jwt
+import jwt
 
 from talent_inbound.modules.auth.domain.entities import User
 from talent_inbound.modules.auth.domain.exceptions import InvalidCredentialsError
 from talent_inbound.modules.auth.domain.repositories import UserRepository
+from talent_inbound.modules.auth.infrastructure.token_cache import AccessTokenCache
 
 
 class GetCurrentUser:
@@ -12,20 +13,39 @@ class GetCurrentUser:
 
     This is called on every authenticated request to resolve
     the current user from the token stored in the HTTP-only cookie.
+
+    Verified tokens are remembered in ``token_cache`` until they expire, so
+    repeat requests skip the decode. The user itself is always reloaded:
+    a deactivated account must be rejected even while its token is valid.
     """
 
     def __init__(
         self,
         user_repo: UserRepository,
         jwt_secret: str,
+        token_cache: AccessTokenCache | None = None,
     ) -> None:
         self._user_repo = user_repo
         self._jwt_secret = jwt_secret
+        self._token_cache = token_cache
 
     async def execute(self, token: str) -> User:
+        user_id = None
+        if self._token_cache is not None:
+            user_id = self._token_cache.get(token)
+        if user_id is None:
+            user_id = self._decode(token)
+
+        user = await self._user_repo.find_by_id(user_id)
+        if not user or not user.is_active:
+            raise InvalidCredentialsError()
+
+        return user
+
+    def _decode(self, token: str) -> str:
         try:
             payload = jwt.decode(token, self._jwt_secret, algorithms=["HS256"])
-        except JWTError:
+        except jwt.PyJWTError:
             raise InvalidCredentialsError()
 
         if payload.get("type") != "access":
@@ -35,8 +55,7 @@ class GetCurrentUser:
         if not user_id:
             raise InvalidCredentialsError()
 
-        user = await self._user_repo.find_by_id(user_id)
-        if not user or not user.is_active:
-            raise InvalidCredentialsError()
-
-        return user
+        exp = payload.get("exp")
+        if self._token_cache is not None and exp is not None:
+            self._token_cache.put(token, user_id, float(exp))
+        return user_id
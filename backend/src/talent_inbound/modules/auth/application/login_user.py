@@ -1,9 +1,9 @@
 """LoginUser use case — authenticates credentials and generates JWT tokens."""
 
+import time
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
 
-from jose import jwt
+import jwt
 
 from talent_inbound.modules.auth.domain.exceptions import (
     InactiveUserError,
@@ -54,20 +54,23 @@ class LoginUser:
         if not user:
             raise InvalidCredentialsError()
 
-        if not self._password_hasher.verify(command.password, user.hashed_password):
+        if not await self._password_hasher.verify_async(
+            command.password, user.hashed_password
+        ):
             raise InvalidCredentialsError()
 
         if not user.is_active:
             raise InactiveUserError()
 
-        now = datetime.now(UTC)
+        # Integer epoch claims: what PyJWT would serialize datetimes to anyway
+        now = int(time.time())
 
         access_token = jwt.encode(
             {
                 "sub": user.id,
                 "email": user.email,
                 "type": "access",
-                "exp": now + timedelta(minutes=self._access_expire_minutes),
+                "exp": now + self._access_expire_minutes * 60,
                 "iat": now,
             },
             self._jwt_secret,
@@ -78,7 +81,7 @@ class LoginUser:
             {
                 "sub": user.id,
                 "type": "refresh",
-                "exp": now + timedelta(days=self._refresh_expire_days),
+                "exp": now + self._refresh_expire_days * 86400,
                 "iat": now,
             },
             self._jwt_secret,
@@ -30,16 +30,14 @@ class RegisterUser:
         self._event_bus = event_bus
 
     async def execute(self, command: RegisterUserCommand) -> User:
-        existing = await self._user_repo.find_by_email(command.email)
-        if existing:
-            raise DuplicateEmailError(command.email)
-
         user = User(
             email=command.email,
-            hashed_password=self._password_hasher.hash(command.password),
+            hashed_password=await self._password_hasher.hash_async(command.password),
         )
 
-        saved_user = await self._user_repo.save(user)
+        saved_user = await self._user_repo.insert_if_unique(user)
+        if saved_user is None:
+            raise DuplicateEmailError(command.email)
 
         event = UserRegistered(user_id=saved_user.id, email=saved_user.email)
         saved_user.add_event(event)
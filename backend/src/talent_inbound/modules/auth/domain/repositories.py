@@ -12,6 +12,10 @@ class UserRepository(ABC):
     async def save(self, user: User) -> User:
         """Persist a new user."""
 
+    @abstractmethod
+    async def insert_if_unique(self, user: User) -> User | None:
+        """Persist a new user unless the email is taken. Returns None if taken."""
+
     @abstractmethod
     async def find_by_email(self, email: str) -> User | None:
         """Find a user by email. Returns None if not found."""
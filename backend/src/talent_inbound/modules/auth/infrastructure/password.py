@@ -1,5 +1,7 @@
 """bcrypt password hasher for secure credential storage."""
 
+import asyncio
+
 import bcrypt
 
 
@@ -10,13 +12,31 @@ class BcryptPasswordHasher:
     password from the hash. Each hash includes a random salt, so the same
     password produces different hashes every time. Verification works by
     re-hashing the candidate password with the stored salt and comparing.
+
+    ``rounds`` is the log2 work factor for new hashes (each +1 doubles the
+    cost). Existing hashes keep the cost they were created with.
     """
 
+    def __init__(self, rounds: int = 12) -> None:
+        self._rounds = rounds
+
     def hash(self, password: str) -> str:
         """Hash a plaintext password. Returns the bcrypt hash string."""
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self._rounds)
         return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
     def verify(self, password: str, hashed: str) -> bool:
         """Check if a plaintext password matches a bcrypt hash."""
         return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+    async def hash_async(self, password: str) -> str:
+        """hash() on a worker thread, so the event loop keeps serving requests.
+
+        bcrypt releases the GIL while it works, so other coroutines run
+        meanwhile.
+        """
+        return await asyncio.to_thread(self.hash, password)
+
+    async def verify_async(self, password: str, hashed: str) -> bool:
+        """verify() on a worker thread (see hash_async)."""
+        return await asyncio.to_thread(self.verify, password, hashed)
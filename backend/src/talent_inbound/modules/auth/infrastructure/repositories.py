@@ -1,11 +1,24 @@
 """SQLAlchemy implementation of the UserRepository."""
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talent_inbound.modules.auth.domain.entities import User
 from talent_inbound.modules.auth.domain.repositories import UserRepository
 from talent_inbound.modules.auth.infrastructure.orm_models import UserModel
+from talent_inbound.shared.infrastructure.database import is_uuid
+
+# Reads select plain columns and build User straight from the row: no ORM
+# instance, identity-map entry or attribute instrumentation per lookup.
+_USER_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.hashed_password,
+    UserModel.is_active,
+    UserModel.created_at,
+    UserModel.updated_at,
+)
 
 
 class SqlAlchemyUserRepository(UserRepository):
@@ -15,20 +28,39 @@ class SqlAlchemyUserRepository(UserRepository):
         self._session = session
 
     async def save(self, user: User) -> User:
-        model = UserModel.from_domain(user)
-        self._session.add(model)
+        # The entity already carries id and timestamps, so the flushed row
+        # matches it exactly — no refresh SELECT or reconversion needed.
+        self._session.add(UserModel.from_domain(user))
         await self._session.flush()
-        await self._session.refresh(model)
-        return model.to_domain()
+        return user
 
-    async def find_by_email(self, email: str) -> User | None:
-        stmt = select(UserModel).where(UserModel.email == email)
+    async def insert_if_unique(self, user: User) -> User | None:
+        # One atomic statement: the unique index on email decides, so two
+        # concurrent registrations can't both pass a SELECT-then-INSERT check.
+        stmt = (
+            insert(UserModel)
+            .values(
+                id=user.id,
+                email=user.email,
+                hashed_password=user.hashed_password,
+                is_active=user.is_active,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+            )
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel.id)
+        )
         result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return model.to_domain() if model else None
+        return user if result.scalar_one_or_none() is not None else None
+
+    async def find_by_email(self, email: str) -> User | None:
+        stmt = select(*_USER_COLUMNS).where(UserModel.email == email)
+        row = (await self._session.execute(stmt)).one_or_none()
+        return User(**row._mapping) if row else None
 
     async def find_by_id(self, user_id: str) -> User | None:
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return model.to_domain() if model else None
+        if not is_uuid(user_id):
+            return None
+        stmt = select(*_USER_COLUMNS).where(UserModel.id == user_id)
+        row = (await self._session.execute(stmt)).one_or_none()
+        return User(**row._mapping) if row else None
@@ -0,0 +1,43 @@
+"""Bounded in-process cache of verified access-token claims."""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+
+class AccessTokenCache:
+    """Maps an access token to its already-verified (user_id, exp).
+
+    A signed token's claims never change, so once a token has been decoded
+    the HMAC check and JSON parse can be skipped until it expires. Keys are
+    BLAKE2b digests, so raw tokens are never kept in memory. Least recently
+    used entries are evicted once ``maxsize`` is reached.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[str, float]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, token: str) -> str | None:
+        """Return the cached user_id, or None if absent or expired."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        user_id, exp = entry
+        if exp <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user_id
+
+    def put(self, token: str, user_id: str, exp: float) -> None:
+        key = self._key(token)
+        self._entries[key] = (user_id, exp)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
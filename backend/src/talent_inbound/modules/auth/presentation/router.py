@@ -1,10 +1,10 @@
 """Auth API router — register, login, logout, refresh."""
 
-from datetime import UTC
+import time
 
+import jwt
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Cookie, Depends, HTTPException, Response, status
-from jose import JWTError, jwt
 
 from talent_inbound.config import Settings
 from talent_inbound.container import Container
@@ -32,40 +32,38 @@ from talent_inbound.modules.auth.presentation.schemas import (
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_REFRESH_COOKIE_PATH = "/api/v1/auth/refresh"  # Only sent to refresh endpoint
+
+# Cookie attributes keyed by "is production", built once at import.
+# Production (HTTPS) needs secure=True and samesite="none" for cross-origin
+# cookies (backend and frontend on different domains); development uses
+# secure=False and samesite="lax".
+_COOKIE_FLAGS = {
+    True: {"httponly": True, "samesite": "none", "secure": True},
+    False: {"httponly": True, "samesite": "lax", "secure": False},
+}
+_ACCESS_COOKIE_KW = {
+    is_prod: {**flags, "max_age": 30 * 60, "path": "/"}  # 30 minutes
+    for is_prod, flags in _COOKIE_FLAGS.items()
+}
+_REFRESH_COOKIE_KW = {
+    is_prod: {**flags, "max_age": 7 * 24 * 60 * 60, "path": _REFRESH_COOKIE_PATH}
+    for is_prod, flags in _COOKIE_FLAGS.items()
+}
+
 
 def _set_auth_cookies(
-    response: Response, access_token: str, refresh_token: str
+    response: Response, access_token: str, refresh_token: str, settings: Settings
 ) -> None:
     """Set JWT tokens as HTTP-only, secure cookies.
 
     HTTP-only means JavaScript cannot read these cookies (XSS protection).
-    In production (HTTPS), uses secure=True and samesite="none" for
-    cross-origin cookies (backend and frontend on different domains).
-    In development, uses secure=False and samesite="lax".
+    The access cookie lives 30 minutes on every path; the refresh cookie
+    lives 7 days and is only sent to the refresh endpoint.
     """
-    from talent_inbound.config import get_settings
-
-    is_prod = not get_settings().is_development
-    samesite_value: str = "none" if is_prod else "lax"
-
-    response.set_cookie(
-        key="access_token",
-        value=access_token,
-        httponly=True,
-        samesite=samesite_value,
-        secure=is_prod,
-        max_age=30 * 60,  # 30 minutes
-        path="/",
-    )
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        samesite=samesite_value,
-        secure=is_prod,
-        max_age=7 * 24 * 60 * 60,  # 7 days
-        path="/api/v1/auth/refresh",  # Only sent to refresh endpoint
-    )
+    is_prod = not settings.is_development
+    response.set_cookie("access_token", access_token, **_ACCESS_COOKIE_KW[is_prod])
+    response.set_cookie("refresh_token", refresh_token, **_REFRESH_COOKIE_KW[is_prod])
 
 
 @router.post(
@@ -94,6 +92,7 @@ async def login(
     body: LoginRequest,
     response: Response,
     login_uc: LoginUser = Depends(Provide[Container.login_user_uc]),
+    settings: Settings = Depends(Provide[Container.config]),
 ) -> MessageResponse:
     try:
         tokens = await login_uc.execute(
@@ -104,14 +103,14 @@ async def login(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
-    _set_auth_cookies(response, tokens.access_token, tokens.refresh_token)
+    _set_auth_cookies(response, tokens.access_token, tokens.refresh_token, settings)
     return MessageResponse(message="Login successful")
 
 
 @router.post("/logout", response_model=MessageResponse)
 async def logout(response: Response) -> MessageResponse:
     response.delete_cookie("access_token", path="/")
-    response.delete_cookie("refresh_token", path="/api/v1/auth/refresh")
+    response.delete_cookie("refresh_token", path=_REFRESH_COOKIE_PATH)
     return MessageResponse(message="Logged out")
 
 
@@ -137,7 +136,7 @@ async def refresh(
         payload = jwt.decode(
             refresh_token, settings.jwt_secret_key, algorithms=["HS256"]
         )
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
@@ -167,30 +166,26 @@ async def refresh(
             detail="User not found or inactive",
         )
 
-    from datetime import datetime, timedelta
-
-    now = datetime.now(UTC)
+    # Integer epoch claims: what PyJWT would serialize datetimes to anyway
+    now = int(time.time())
     new_access = jwt.encode(
         {
             "sub": user.id,
             "email": user.email,
             "type": "access",
-            "exp": now + timedelta(minutes=settings.jwt_access_token_expire_minutes),
+            "exp": now + settings.jwt_access_token_expire_minutes * 60,
             "iat": now,
         },
         settings.jwt_secret_key,
         algorithm="HS256",
     )
 
-    is_prod = not settings.is_development
     response.set_cookie(
-        key="access_token",
-        value=new_access,
-        httponly=True,
-        samesite="none" if is_prod else "lax",
-        secure=is_prod,
+        "access_token",
+        new_access,
         max_age=settings.jwt_access_token_expire_minutes * 60,
         path="/",
+        **_COOKIE_FLAGS[not settings.is_development],
     )
     return MessageResponse(message="Token refreshed")
 
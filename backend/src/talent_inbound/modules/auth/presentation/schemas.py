@@ -1,9 +1,16 @@
 """Auth API request/response schemas (Pydantic v2)."""
 
 import re
+import string
 
 from pydantic import BaseModel, field_validator
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+# ASCII letter classes for password strength (same as [A-Z] / [a-z]).
+# isdisjoint() scans in C and stops at the first member found.
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+
 
 class RegisterRequest(BaseModel):
     """Registration payload with password strength validation.
@@ -17,8 +24,7 @@ class RegisterRequest(BaseModel):
     @field_validator("email")
     @classmethod
     def validate_email(cls, v: str) -> str:
-        pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-        if not re.match(pattern, v):
+        if not _EMAIL_RE.match(v):
             raise ValueError("Invalid email format")
         return v.lower().strip()
 
@@ -27,11 +33,11 @@ class RegisterRequest(BaseModel):
     def validate_password_strength(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters")
-        if not re.search(r"[A-Z]", v):
+        if _UPPER.isdisjoint(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
+        if _LOWER.isdisjoint(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
+        if not any(map(str.isdecimal, v)):  # same set as \d
             raise ValueError("Password must contain at least one digit")
         return v
 
@@ -21,7 +21,6 @@ from talent_inbound.shared.domain.enums import (
 )
 from talent_inbound.shared.infrastructure.event_bus import InProcessEventBus
 
-import re
 
 @dataclass
 class SubmitMessageCommand:
@@ -70,14 +69,16 @@ class SubmitMessage:
         )
 
         # Phase 1: Exact hash check (fast path — catches identical copy-pastes)
-        existing = await self._interaction_repo.find_duplicate(
+        existing_id = await self._interaction_repo.find_duplicate_opportunity_id(
             interaction.content_hash, command.candidate_id
         )
-        if existing and existing.opportunity_id:
-            raise DuplicateInteractionError(existing.opportunity_id)
+        if existing_id:
+            raise DuplicateInteractionError(existing_id)
 
         # Phase 2: Field-based check (catches near-duplicates — same offer, different wording)
-        similar_id = await self._find_field_based_duplicate(stripped, command.candidate_id)
+        similar_id = await self._opportunity_repo.find_field_duplicate(
+            command.candidate_id, stripped
+        )
         if similar_id:
             raise DuplicateInteractionError(similar_id)
 
@@ -106,32 +107,3 @@ class SubmitMessage:
             interaction=saved_interaction,
             opportunity=saved_opportunity,
         )
-
-    async def _find_field_based_duplicate(
-        self, raw_content: str, candidate_id: str
-    ) -> str | None:
-        """Detect near-duplicate offers by comparing extracted fields from existing
-        opportunities against the new raw content.
-
-        Matches when company_name AND role_title from a previous opportunity both
-        appear in the new message (case-insensitive). This catches the same offer
-        pasted again with minor wording changes that would defeat the hash check.
-        """
-        content_lower = raw_content.lower()
-        existing = await self._opportunity_repo.list_by_candidate(candidate_id)
-
-        for opp in existing:
-            company = (opp.company_name or "").strip().lower()
-            role = (opp.role_title or "").strip().lower()
-
-            # Skip if we don't have extracted data yet (pipeline may not have run)
-            if not company or not role:
-                continue
-
-            company_match = bool(re.search(r"\b" + re.escape(company) + r"\b", content_lower))
-            role_match = bool(re.search(r"\b" + re.escape(role) + r"\b", content_lower))
-
-            if company_match and role_match:
-                return opp.id
-
-        return None
@@ -1,6 +1,7 @@
 """Interaction domain entity for the ingestion module."""
 
 import hashlib
+from functools import cached_property
 
 from talent_inbound.shared.domain.base_entity import Entity
 from talent_inbound.shared.domain.enums import (
@@ -24,11 +25,19 @@ class Interaction(Entity):
     classification: Classification | None = None
     pipeline_log: list[dict] = []
 
-    @property
-    def content_hash(self) -> str:
-        """SHA-256 hash of raw_content + source for duplicate detection."""
-        payload = f"{self.raw_content}|{self.source.value}"
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    @cached_property
+    def content_hash(self) -> bytes:
+        """Raw SHA-256 digest of raw_content + source for duplicate detection.
+
+        Computed once per instance: raw_content and source are set at
+        ingestion and never reassigned. Dedup key only, hence
+        usedforsecurity=False; stays SHA-256 so stored hashes keep matching.
+        """
+        # Fed in pieces: no intermediate "content|source" string to build
+        h = hashlib.sha256(self.raw_content.encode("utf-8"), usedforsecurity=False)
+        h.update(b"|")
+        h.update(self.source.value.encode("ascii"))
+        return h.digest()
 
     def mark_processing(self) -> None:
         self.processing_status = ProcessingStatus.PROCESSING
@@ -17,10 +17,11 @@ class InteractionRepository(ABC):
         """Find interaction by ID."""
 
     @abstractmethod
-    async def find_duplicate(
-        self, content_hash: str, candidate_id: str
-    ) -> Interaction | None:
-        """Find an existing interaction with the same content hash for this candidate."""
+    async def find_duplicate_opportunity_id(
+        self, content_hash: bytes, candidate_id: str
+    ) -> str | None:
+        """Opportunity id of an existing interaction with the same content hash
+        for this candidate, or None."""
 
     @abstractmethod
     async def update(self, interaction: Interaction) -> Interaction:
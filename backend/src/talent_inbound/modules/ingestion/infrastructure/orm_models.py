@@ -1,10 +1,19 @@
 """SQLAlchemy ORM model for the Interaction entity."""
 
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    DateTime,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from talent_inbound.modules.ingestion.domain.entities import Interaction
@@ -17,22 +26,28 @@ class InteractionModel(Base):
     __tablename__ = "interactions"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     candidate_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     opportunity_id: Mapped[str | None] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("opportunities.id", ondelete="SET NULL"),
         nullable=True,
         index=True,
     )
-    raw_content: Mapped[str] = mapped_column(Text, nullable=False)
-    sanitized_content: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # set_updated_at trigger
+    )
     source: Mapped[str] = mapped_column(String(30), nullable=False)
     interaction_type: Mapped[str] = mapped_column(
         String(20), nullable=False, default="INITIAL"
@@ -41,21 +56,13 @@ class InteractionModel(Base):
         String(20), nullable=False, default="PENDING"
     )
     classification: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    content_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
+    # Large TOASTable payloads last, after the fixed-width and short columns
+    raw_content: Mapped[str] = mapped_column(Text, nullable=False)
+    sanitized_content: Mapped[str | None] = mapped_column(Text, nullable=True)
     pipeline_log: Mapped[dict | None] = mapped_column(
         JSONB, nullable=True, default=list
     )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        nullable=False,
-        default=lambda: datetime.now(UTC),
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        nullable=False,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
-    )
 
     def to_domain(self) -> Interaction:
         """Convert ORM model to domain entity."""
@@ -75,22 +82,37 @@ class InteractionModel(Base):
         )
 
     @staticmethod
-    def from_domain(interaction: Interaction) -> "InteractionModel":
-        """Create ORM model from domain entity."""
-        return InteractionModel(
-            id=interaction.id,
-            candidate_id=interaction.candidate_id,
-            opportunity_id=interaction.opportunity_id,
-            raw_content=interaction.raw_content,
-            sanitized_content=interaction.sanitized_content,
-            source=interaction.source.value,
-            interaction_type=interaction.interaction_type.value,
-            processing_status=interaction.processing_status.value,
-            classification=(
+    def to_mapping(interaction: Interaction) -> dict:
+        """Column → value dict for a Core insert of a domain entity."""
+        return {
+            "id": interaction.id,
+            "candidate_id": interaction.candidate_id,
+            "opportunity_id": interaction.opportunity_id,
+            "raw_content": interaction.raw_content,
+            "sanitized_content": interaction.sanitized_content,
+            "source": interaction.source.value,
+            "interaction_type": interaction.interaction_type.value,
+            "processing_status": interaction.processing_status.value,
+            "classification": (
                 interaction.classification.value if interaction.classification else None
             ),
-            content_hash=interaction.content_hash,
-            pipeline_log=interaction.pipeline_log,
-            created_at=interaction.created_at,
-            updated_at=interaction.updated_at,
-        )
+            "content_hash": interaction.content_hash,
+            "pipeline_log": interaction.pipeline_log,
+            "created_at": interaction.created_at,
+            "updated_at": interaction.updated_at,
+        }
+
+    @staticmethod
+    def from_domain(interaction: Interaction) -> "InteractionModel":
+        """Create ORM model from domain entity."""
+        return InteractionModel(**InteractionModel.to_mapping(interaction))
+
+# Exact-duplicate lookup (candidate_id, content_hash) → opportunity_id as an
+# index-only scan; also serves candidate_id-only filters. Must match
+# add_interactions_candidate_hash_index.
+Index(
+    "ix_interactions_candidate_hash",
+    InteractionModel.candidate_id,
+    InteractionModel.content_hash,
+    postgresql_include=["opportunity_id"],
+)
@@ -1,11 +1,12 @@
 """SQLAlchemy implementation of the InteractionRepository."""
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talent_inbound.modules.ingestion.domain.entities import Interaction
 from talent_inbound.modules.ingestion.domain.repositories import InteractionRepository
 from talent_inbound.modules.ingestion.infrastructure.orm_models import InteractionModel
+from talent_inbound.shared.infrastructure.database import is_uuid
 
 
 class SqlAlchemyInteractionRepository(InteractionRepository):
@@ -15,37 +16,38 @@ class SqlAlchemyInteractionRepository(InteractionRepository):
         self._session = session
 
     async def save(self, interaction: Interaction) -> Interaction:
-        model = InteractionModel.from_domain(interaction)
-        self._session.add(model)
-        await self._session.flush()
-        await self._session.refresh(model)
-        return model.to_domain()
+        # Core INSERT from a plain dict: the entity already carries every
+        # column value, so no ORM instance or unit-of-work flush is needed.
+        await self._session.execute(
+            insert(InteractionModel).values(InteractionModel.to_mapping(interaction))
+        )
+        return interaction
 
     async def find_by_id(self, interaction_id: str) -> Interaction | None:
-        stmt = select(InteractionModel).where(InteractionModel.id == interaction_id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        if not is_uuid(interaction_id):
+            return None
+        # PK lookup: served from the identity map when already loaded
+        model = await self._session.get(InteractionModel, interaction_id)
         return model.to_domain() if model else None
 
-    async def find_duplicate(
-        self, content_hash: str, candidate_id: str
-    ) -> Interaction | None:
+    async def find_duplicate_opportunity_id(
+        self, content_hash: bytes, candidate_id: str
+    ) -> str | None:
+        # Only the linked id: no raw_content/pipeline_log transfer or hydration
         stmt = (
-            select(InteractionModel)
+            select(InteractionModel.opportunity_id)
             .where(
                 InteractionModel.content_hash == content_hash,
                 InteractionModel.candidate_id == candidate_id,
+                InteractionModel.opportunity_id.is_not(None),
             )
             .limit(1)
         )
         result = await self._session.execute(stmt)
-        model = result.scalars().first()
-        return model.to_domain() if model else None
+        return result.scalar_one_or_none()
 
     async def update(self, interaction: Interaction) -> Interaction:
-        stmt = select(InteractionModel).where(InteractionModel.id == interaction.id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        model = await self._session.get(InteractionModel, interaction.id)
         if model is None:
             raise ValueError(f"Interaction not found: {interaction.id}")
 
@@ -57,5 +59,4 @@ class SqlAlchemyInteractionRepository(InteractionRepository):
         )
         model.pipeline_log = interaction.pipeline_log
         await self._session.flush()
-        await self._session.refresh(model)
         return model.to_domain()
@@ -4,6 +4,7 @@ import structlog
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from talent_inbound.config import Settings
 from talent_inbound.container import Container
 from talent_inbound.modules.auth.domain.entities import User
 from talent_inbound.modules.auth.presentation.dependencies import get_current_user
@@ -47,6 +48,7 @@ async def submit_message(
     ),
     model_router: ModelRouter = Depends(Provide[Container.model_router]),
     sse_emitter: SSEEmitter = Depends(Provide[Container.sse_emitter]),
+    settings: Settings = Depends(Provide[Container.config]),
 ) -> SubmitMessageResponse:
     try:
         result = await submit_message_uc.execute(
@@ -73,23 +75,12 @@ async def submit_message(
 
     # Run pipeline inline (mock agents are instant; real LLM would use Arq worker)
     try:
-        from talent_inbound.config import get_settings as _gs
-
-        _settings = _gs()
-        scoring_weights = {
-            "base": _settings.scoring_base,
-            "skills": _settings.scoring_skills_weight,
-            "wm_match": _settings.scoring_work_model_match,
-            "wm_mismatch": _settings.scoring_work_model_mismatch,
-            "sal_meets": _settings.scoring_salary_meets_min,
-            "sal_below": _settings.scoring_salary_below_min,
-        }
         opp_repo = Container.opportunity_repo()
         profile_repo = Container.profile_repo()
         graph = build_main_pipeline(
             model_router,
             profile_repo=profile_repo,
-            scoring_weights=scoring_weights,
+            scoring_weights=settings.scoring_weights,
             opportunity_repo=opp_repo,
         )
         pipeline_uc = ProcessPipeline(
@@ -98,17 +89,17 @@ async def submit_message(
             pipeline_graph=graph,
             sse_emitter=sse_emitter,
         )
-        await pipeline_uc.execute(result.interaction.id)
-        # Re-fetch opportunity to get updated stage after pipeline
-        updated_opp = await opp_repo.find_by_id(result.opportunity.id)
+        # The use case reports the stage it persisted: no re-fetch needed
         final_stage = (
-            updated_opp.stage.value if updated_opp else result.opportunity.stage.value
+            await pipeline_uc.execute(result.interaction.id)
+            or result.opportunity.stage.value
         )
     except Exception:
         logger.exception("inline_pipeline_failed")
         final_stage = result.opportunity.stage.value
 
-    return SubmitMessageResponse(
+    # model_construct: fields come from validated entities, skip re-validation
+    return SubmitMessageResponse.model_construct(
         interaction_id=result.interaction.id,
         opportunity_id=result.opportunity.id,
         stage=final_stage,
@@ -129,7 +120,7 @@ async def get_interaction(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Interaction not found."
         )
-    return InteractionResponse(
+    return InteractionResponse.model_construct(
         id=interaction.id,
         opportunity_id=interaction.opportunity_id,
         source=interaction.source.value,
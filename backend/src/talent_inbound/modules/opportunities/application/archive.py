@@ -28,7 +28,6 @@ class ArchiveOpportunity:
             )
 
         opportunity.is_archived = True
-        opportunity.touch()
         return await self._repo.update(opportunity)
 
 
@@ -44,5 +43,4 @@ class UnarchiveOpportunity:
             raise OpportunityNotFoundError(opportunity_id)
 
         opportunity.is_archived = False
-        opportunity.touch()
         return await self._repo.update(opportunity)
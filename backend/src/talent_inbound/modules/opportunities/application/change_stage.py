@@ -41,7 +41,6 @@ class ChangeStage:
             note=command.note,
         )
 
-        await self._repo.update(opportunity)
-        await self._repo.save_transition(transition)
+        await self._repo.update_with_transition(opportunity, transition)
 
         return transition
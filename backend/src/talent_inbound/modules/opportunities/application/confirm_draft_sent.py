@@ -2,9 +2,11 @@
 a CANDIDATE_RESPONSE interaction to record it in the timeline.
 Auto-advances DISCOVERY → ENGAGING on first send."""
 
+import hashlib
+import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import and_, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talent_inbound.modules.ingestion.infrastructure.orm_models import InteractionModel
@@ -35,22 +37,24 @@ class ConfirmDraftSent:
     ) -> dict:
         session: AsyncSession = get_current_session()
 
-        # Verify opportunity ownership
-        opp_stmt = select(OpportunityModel).where(
-            OpportunityModel.id == opportunity_id
+        # Opportunity + draft in one round trip. The outer join keeps the
+        # opportunity row when the draft doesn't match, so the two "not
+        # found" cases stay distinguishable.
+        stmt = (
+            select(OpportunityModel, DraftResponseModel)
+            .outerjoin(
+                DraftResponseModel,
+                and_(
+                    DraftResponseModel.opportunity_id == OpportunityModel.id,
+                    DraftResponseModel.id == draft_id,
+                ),
+            )
+            .where(OpportunityModel.id == opportunity_id)
         )
-        opp_result = await session.execute(opp_stmt)
-        opp_check = opp_result.scalar_one_or_none()
-        if opp_check is None or opp_check.candidate_id != candidate_id:
+        row = (await session.execute(stmt)).one_or_none()
+        if row is None or row.OpportunityModel.candidate_id != candidate_id:
             raise ValueError("Opportunity not found")
-
-        # Load draft
-        stmt = select(DraftResponseModel).where(
-            DraftResponseModel.id == draft_id,
-            DraftResponseModel.opportunity_id == opportunity_id,
-        )
-        result = await session.execute(stmt)
-        draft = result.scalar_one_or_none()
+        opp, draft = row
 
         if draft is None:
             raise ValueError("Draft not found")
@@ -65,79 +69,64 @@ class ConfirmDraftSent:
         draft.sent_at = now
 
         # Create CANDIDATE_RESPONSE interaction
-        import hashlib
-        import uuid
-
         sent_text = draft.edited_content or draft.generated_content
-        content_hash = hashlib.sha256(
-            f"{sent_text}|CANDIDATE_RESPONSE".encode()
-        ).hexdigest()
-
-        interaction = InteractionModel(
-            id=str(uuid.uuid4()),
-            candidate_id=candidate_id,
-            opportunity_id=opportunity_id,
-            raw_content=sent_text,
-            source="OTHER",
-            interaction_type=InteractionType.CANDIDATE_RESPONSE.value,
-            processing_status=ProcessingStatus.COMPLETED.value,
-            content_hash=content_hash,
-            created_at=now,
-            updated_at=now,
-        )
-        session.add(interaction)
+        # Fed in pieces: no joined "text|CANDIDATE_RESPONSE" copy of the draft
+        h = hashlib.sha256(sent_text.encode(), usedforsecurity=False)
+        h.update(b"|CANDIDATE_RESPONSE")
+        content_hash = h.digest()
+
+        interaction_id = str(uuid.uuid4())
+        interaction_row = {
+            "id": interaction_id,
+            "candidate_id": candidate_id,
+            "opportunity_id": opportunity_id,
+            "raw_content": sent_text,
+            "source": "OTHER",
+            "interaction_type": InteractionType.CANDIDATE_RESPONSE.value,
+            "processing_status": ProcessingStatus.COMPLETED.value,
+            "content_hash": content_hash,
+            "created_at": now,
+            "updated_at": now,
+        }
 
         # Update opportunity.last_interaction_at + auto-advance stage
-        opp_stmt = select(OpportunityModel).where(OpportunityModel.id == opportunity_id)
-        opp_result = await session.execute(opp_stmt)
-        opp = opp_result.scalar_one_or_none()
-        if opp:
-            opp.last_interaction_at = now
-
-            current_stage = OpportunityStage(opp.stage)
-
-            # Auto-advance: → DECLINED when user confirms a DECLINE draft
-            if (
-                draft.response_type == ResponseType.DECLINE.value
-                and current_stage not in TERMINAL_STAGES
-            ):
-                from_stage = opp.stage
-                opp.stage = OpportunityStage.DECLINED.value
-
-                transition = StageTransitionModel(
-                    id=str(uuid.uuid4()),
-                    opportunity_id=opportunity_id,
-                    from_stage=from_stage,
-                    to_stage=OpportunityStage.DECLINED.value,
-                    triggered_by=TransitionTrigger.SYSTEM.value,
-                    is_unusual=False,
-                    note="Auto-advanced: user sent a decline response",
-                    created_at=now,
-                    updated_at=now,
-                )
-                session.add(transition)
-
-            # Auto-advance: DISCOVERY → ENGAGING when user sends first response
-            elif opp.stage == OpportunityStage.DISCOVERY.value:
-                from_stage = opp.stage
-                opp.stage = OpportunityStage.ENGAGING.value
-
-                transition = StageTransitionModel(
+        opp.last_interaction_at = now
+        from_stage = opp.stage
+        transition_note = None
+
+        # Auto-advance: → DECLINED when user confirms a DECLINE draft
+        if (
+            draft.response_type == ResponseType.DECLINE.value
+            and opp.stage not in TERMINAL_STAGES
+        ):
+            opp.stage = OpportunityStage.DECLINED.value
+            transition_note = "Auto-advanced: user sent a decline response"
+
+        # Auto-advance: DISCOVERY → ENGAGING when user sends first response
+        elif opp.stage == OpportunityStage.DISCOVERY.value:
+            opp.stage = OpportunityStage.ENGAGING.value
+            transition_note = "Auto-advanced: user sent first response"
+
+        # Draft + opportunity UPDATEs go through the unit of work; the new rows
+        # are fully built here, so they are Core INSERTs (no ORM instances).
+        await session.flush()
+        await session.execute(insert(InteractionModel).values(interaction_row))
+        if transition_note is not None:
+            await session.execute(
+                insert(StageTransitionModel).values(
                     id=str(uuid.uuid4()),
                     opportunity_id=opportunity_id,
                     from_stage=from_stage,
-                    to_stage=OpportunityStage.ENGAGING.value,
+                    to_stage=opp.stage,
                     triggered_by=TransitionTrigger.SYSTEM.value,
                     is_unusual=False,
-                    note="Auto-advanced: user sent first response",
+                    note=transition_note,
                     created_at=now,
                     updated_at=now,
                 )
-                session.add(transition)
-
-        await session.flush()
+            )
 
         return {
             "draft_id": draft_id,
-            "interaction_id": interaction.id,
+            "interaction_id": interaction_id,
         }
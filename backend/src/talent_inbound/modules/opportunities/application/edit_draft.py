@@ -1,9 +1,7 @@
 """EditDraft use case — update edited_content and optionally mark as final."""
 
-from sqlalchemy import select
-
 from talent_inbound.modules.opportunities.infrastructure.orm_models import (
-    DraftResponseModel,
+    draft_lookup_stmt,
 )
 from talent_inbound.shared.infrastructure.database import get_current_session
 
@@ -25,11 +23,10 @@ class EditDraft:
         """
         session = get_current_session()
 
-        stmt = select(DraftResponseModel).where(
-            DraftResponseModel.id == draft_id,
-            DraftResponseModel.opportunity_id == opportunity_id,
+        result = await session.execute(
+            draft_lookup_stmt,
+            {"draft_id": draft_id, "opportunity_id": opportunity_id},
         )
-        result = await session.execute(stmt)
         draft = result.scalar_one_or_none()
 
         if draft is None:
@@ -40,8 +37,7 @@ class EditDraft:
         if is_final is not None:
             draft.is_final = is_final
 
-        await session.flush()
-        await session.refresh(draft)
+        await session.flush()  # eager_defaults: updated_at comes back via RETURNING
 
         return {
             "id": draft.id,
@@ -1,6 +1,7 @@
 """GenerateDraft use case — invoke Communicator agent for on-demand draft generation."""
 
 import structlog
+from sqlalchemy import insert
 
 from talent_inbound.modules.opportunities.domain.exceptions import (
     OpportunityNotFoundError,
@@ -8,6 +9,9 @@ from talent_inbound.modules.opportunities.domain.exceptions import (
 from talent_inbound.modules.opportunities.domain.repositories import (
     OpportunityRepository,
 )
+from talent_inbound.modules.opportunities.infrastructure.orm_models import (
+    DraftResponseModel,
+)
 from talent_inbound.modules.pipeline.infrastructure.agents.communicator import (
     generate_draft_standalone,
 )
@@ -15,6 +19,7 @@ from talent_inbound.modules.pipeline.infrastructure.agents.guardrail import (
     check_guardrail,
 )
 from talent_inbound.shared.domain.enums import ResponseType
+from talent_inbound.shared.infrastructure.database import get_current_session
 
 logger = structlog.get_logger()
 
@@ -149,28 +154,32 @@ class GenerateDraft:
         )
 
         # Persist
-        from talent_inbound.modules.opportunities.infrastructure.orm_models import (
-            DraftResponseModel,
-        )
-        from talent_inbound.shared.infrastructure.database import get_current_session
-
+        # One INSERT ... RETURNING for the generated/default columns; the rest
+        # of the row is what we just wrote.
         session = get_current_session()
-        draft_model = DraftResponseModel(
-            opportunity_id=opportunity_id,
-            response_type=rt.value,
-            generated_content=draft_text,
+        stmt = (
+            insert(DraftResponseModel)
+            .values(
+                opportunity_id=opportunity_id,
+                response_type=rt.value,
+                generated_content=draft_text,
+            )
+            .returning(
+                DraftResponseModel.id,
+                DraftResponseModel.is_final,
+                DraftResponseModel.is_sent,
+                DraftResponseModel.created_at,
+            )
         )
-        session.add(draft_model)
-        await session.flush()
-        await session.refresh(draft_model)
+        row = (await session.execute(stmt)).one()
 
         return {
-            "id": draft_model.id,
-            "response_type": draft_model.response_type,
-            "generated_content": draft_model.generated_content,
-            "edited_content": draft_model.edited_content,
-            "is_final": draft_model.is_final,
-            "is_sent": draft_model.is_sent,
-            "sent_at": draft_model.sent_at,
-            "created_at": draft_model.created_at,
+            "id": row.id,
+            "response_type": rt.value,
+            "generated_content": draft_text,
+            "edited_content": None,
+            "is_final": row.is_final,
+            "is_sent": row.is_sent,
+            "sent_at": None,
+            "created_at": row.created_at,
         }
@@ -5,7 +5,7 @@ import hashlib
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from talent_inbound.modules.ingestion.infrastructure.orm_models import InteractionModel
@@ -15,7 +15,6 @@ from talent_inbound.modules.opportunities.infrastructure.orm_models import (
 from talent_inbound.shared.domain.enums import (
     TERMINAL_STAGES,
     InteractionType,
-    OpportunityStage,
     ProcessingStatus,
 )
 from talent_inbound.shared.infrastructure.database import get_current_session
@@ -34,11 +33,7 @@ class SubmitFollowUp:
         session: AsyncSession = get_current_session()
 
         # Load opportunity
-        opp_stmt = select(OpportunityModel).where(
-            OpportunityModel.id == opportunity_id,
-        )
-        result = await session.execute(opp_stmt)
-        opp = result.scalar_one_or_none()
+        opp = await session.get(OpportunityModel, opportunity_id)
 
         if opp is None:
             raise ValueError("Opportunity not found")
@@ -47,8 +42,7 @@ class SubmitFollowUp:
         if opp.is_archived:
             raise ValueError("Cannot add follow-up to an archived opportunity")
 
-        current_stage = OpportunityStage(opp.stage)
-        if current_stage in TERMINAL_STAGES:
+        if opp.stage in TERMINAL_STAGES:
             raise ValueError(
                 f"Cannot add follow-up to an opportunity in terminal stage: {opp.stage}"
             )
@@ -56,28 +50,36 @@ class SubmitFollowUp:
         now = datetime.now(UTC)
 
         # Create FOLLOW_UP interaction
-        content_hash = hashlib.sha256(f"{raw_content}|{source}".encode()).hexdigest()
+        # Fed in pieces (same digest as Interaction.content_hash): no joined
+        # "content|source" copy of the message
+        h = hashlib.sha256(raw_content.encode(), usedforsecurity=False)
+        h.update(b"|")
+        h.update(source.encode())
+        content_hash = h.digest()
 
-        interaction = InteractionModel(
-            id=str(uuid.uuid4()),
-            candidate_id=candidate_id,
-            opportunity_id=opportunity_id,
-            raw_content=raw_content,
-            source=source,
-            interaction_type=InteractionType.FOLLOW_UP.value,
-            processing_status=ProcessingStatus.PENDING.value,
-            content_hash=content_hash,
-            created_at=now,
-            updated_at=now,
-        )
-        session.add(interaction)
+        interaction_id = str(uuid.uuid4())
 
         # Update last_interaction_at (no stage change — pipeline handles that)
         opp.last_interaction_at = now
 
-        await session.flush()
+        # Autoflush sends the opportunity UPDATE first; the fully built
+        # interaction row is a Core INSERT (no ORM instance to track).
+        await session.execute(
+            insert(InteractionModel).values(
+                id=interaction_id,
+                candidate_id=candidate_id,
+                opportunity_id=opportunity_id,
+                raw_content=raw_content,
+                source=source,
+                interaction_type=InteractionType.FOLLOW_UP.value,
+                processing_status=ProcessingStatus.PENDING.value,
+                content_hash=content_hash,
+                created_at=now,
+                updated_at=now,
+            )
+        )
 
         return {
-            "interaction_id": interaction.id,
+            "interaction_id": interaction_id,
             "opportunity_id": opportunity_id,
         }
@@ -6,7 +6,7 @@ from pydantic import Field
 
 from talent_inbound.shared.domain.base_entity import AggregateRoot, Entity, _utcnow
 from talent_inbound.shared.domain.enums import (
-    STAGE_FLOW,
+    STAGE_INDEX,
     TERMINAL_STAGES,
     OpportunityStage,
     RecruiterType,
@@ -15,6 +15,46 @@ from talent_inbound.shared.domain.enums import (
 )
 
 
+def _compute_is_unusual(
+    from_stage: OpportunityStage, to_stage: OpportunityStage
+) -> bool:
+    """Check if a transition is unusual (skip, backward, or from terminal).
+
+    Rules:
+    - Moving FROM a terminal stage is always unusual.
+    - Within STAGE_FLOW: backward or skipping >1 stage is unusual.
+    - Going to OFFER without reaching NEGOTIATING first is unusual
+      (skipping stages toward a positive outcome).
+    """
+    if from_stage in TERMINAL_STAGES:
+        return True
+
+    if from_stage in STAGE_INDEX and to_stage in STAGE_INDEX:
+        from_idx = STAGE_INDEX[from_stage]
+        to_idx = STAGE_INDEX[to_stage]
+        if to_idx < from_idx:
+            return True
+        if to_idx - from_idx > 1:
+            return True
+
+    # OFFER should follow NEGOTIATING — skipping to it is unusual
+    if to_stage == OpportunityStage.OFFER and from_stage in STAGE_INDEX:
+        if from_stage != OpportunityStage.NEGOTIATING:
+            return True
+
+    return False
+
+
+# Every (from, to) pair the rules flag, enumerated once at import: the stage
+# set is small and fixed, so a transition check is a single set lookup.
+_UNUSUAL_TRANSITIONS = frozenset(
+    (from_stage, to_stage)
+    for from_stage in OpportunityStage
+    for to_stage in OpportunityStage
+    if _compute_is_unusual(from_stage, to_stage)
+)
+
+
 class StageTransition(Entity):
     """Audit log entry for a stage change on an Opportunity."""
 
@@ -74,31 +114,8 @@ class Opportunity(AggregateRoot):
         return transition
 
     def _is_unusual_transition(self, new_stage: OpportunityStage) -> bool:
-        """Check if the transition is unusual (skip, backward, or from terminal).
-
-        Rules:
-        - Moving FROM a terminal stage is always unusual.
-        - Within STAGE_FLOW: backward or skipping >1 stage is unusual.
-        - Going to OFFER without reaching NEGOTIATING first is unusual
-          (skipping stages toward a positive outcome).
-        """
-        if self.stage in TERMINAL_STAGES:
-            return True
-
-        if self.stage in STAGE_FLOW and new_stage in STAGE_FLOW:
-            from_idx = STAGE_FLOW.index(self.stage)
-            to_idx = STAGE_FLOW.index(new_stage)
-            if to_idx < from_idx:
-                return True
-            if to_idx - from_idx > 1:
-                return True
-
-        # OFFER should follow NEGOTIATING — skipping to it is unusual
-        if new_stage == OpportunityStage.OFFER and self.stage in STAGE_FLOW:
-            if self.stage != OpportunityStage.NEGOTIATING:
-                return True
-
-        return False
+        """Check if the transition is unusual (see _compute_is_unusual)."""
+        return (self.stage, new_stage) in _UNUSUAL_TRANSITIONS
 
     def accept_stage_suggestion(self) -> StageTransition | None:
         """Accept the AI-suggested stage and clear the suggestion."""
@@ -35,10 +35,24 @@ class OpportunityRepository(ABC):
             "all" → everything
         """
 
+    @abstractmethod
+    async def find_field_duplicate(
+        self, candidate_id: str, content: str
+    ) -> str | None:
+        """Return the id of the newest non-archived opportunity whose
+        company_name and role_title both appear as whole words in content
+        (case-insensitive), or None."""
+
     @abstractmethod
     async def update(self, opportunity: Opportunity) -> Opportunity:
         """Update an existing opportunity."""
 
+    @abstractmethod
+    async def update_with_transition(
+        self, opportunity: Opportunity, transition: StageTransition
+    ) -> Opportunity:
+        """Update an opportunity and persist its stage transition together."""
+
     @abstractmethod
     async def delete(self, opportunity_id: str) -> None:
         """Permanently delete an opportunity and all related data (cascading)."""
@@ -1,20 +1,41 @@
 """SQLAlchemy ORM models for Opportunity and StageTransition entities."""
 
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import StrEnum
 
 import sqlalchemy as sa
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    bindparam,
+    func,
+    lambda_stmt,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from talent_inbound.modules.opportunities.domain.entities import (
     Opportunity,
     StageTransition,
 )
+from talent_inbound.shared.domain.enums import OpportunityStage
 from talent_inbound.shared.infrastructure.database import Base
 
+# Native PostgreSQL enum (4 bytes per value) shared by every stage column.
+# Must match convert_stage_columns_to_enum.
+opportunity_stage_enum = Enum(
+    *(stage.value for stage in OpportunityStage), name="opportunity_stage"
+)
+
 
 class OpportunityModel(Base):
     """opportunities table — maps to the Opportunity domain entity."""
@@ -22,10 +43,10 @@ class OpportunityModel(Base):
     __tablename__ = "opportunities"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     candidate_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -48,24 +69,24 @@ class OpportunityModel(Base):
         ARRAY(String), nullable=True, default=list
     )
     stage: Mapped[str] = mapped_column(
-        String(30), nullable=False, default="DISCOVERY", index=True
+        opportunity_stage_enum, nullable=False, default="DISCOVERY"
+    )
+    suggested_stage: Mapped[str | None] = mapped_column(
+        opportunity_stage_enum, nullable=True
     )
-    suggested_stage: Mapped[str | None] = mapped_column(String(30), nullable=True)
     suggested_stage_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_archived: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     last_interaction_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True, index=True
+        DateTime(timezone=True), nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        nullable=False,
-        default=lambda: datetime.now(UTC),
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # set_updated_at trigger
     )
 
     def to_domain(self) -> Opportunity:
@@ -140,35 +161,48 @@ class OpportunityModel(Base):
         )
 
 
+# Candidate-scoped indexes: recency listing of non-archived opportunities
+# (stale query) and stage filters. Must match add_opportunity_partial_indexes.
+Index(
+    "ix_opportunities_candidate_last_interaction",
+    OpportunityModel.candidate_id,
+    OpportunityModel.last_interaction_at.desc(),
+    postgresql_where=OpportunityModel.is_archived == False,  # noqa: E712
+)
+Index(
+    "ix_opportunities_candidate_stage",
+    OpportunityModel.candidate_id,
+    OpportunityModel.stage,
+)
+
+
 class StageTransitionModel(Base):
     """stage_transitions table — audit log for opportunity stage changes."""
 
     __tablename__ = "stage_transitions"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     opportunity_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("opportunities.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    from_stage: Mapped[str] = mapped_column(String(30), nullable=False)
-    to_stage: Mapped[str] = mapped_column(String(30), nullable=False)
+    from_stage: Mapped[str] = mapped_column(opportunity_stage_enum, nullable=False)
+    to_stage: Mapped[str] = mapped_column(opportunity_stage_enum, nullable=False)
     triggered_by: Mapped[str] = mapped_column(String(20), nullable=False)
     is_unusual: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     note: Mapped[str | None] = mapped_column(String(500), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        nullable=False,
-        default=lambda: datetime.now(UTC),
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # set_updated_at trigger
     )
 
     def to_domain(self) -> StageTransition:
@@ -207,10 +241,10 @@ class DraftResponseModel(Base):
     __tablename__ = "draft_responses"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     opportunity_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("opportunities.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -226,13 +260,22 @@ class DraftResponseModel(Base):
         DateTime(timezone=True), nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        nullable=False,
-        default=lambda: datetime.now(UTC),
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # set_updated_at trigger
     )
+
+
+# Draft by id, scoped to its opportunity (edit / delete). A lambda statement
+# caches both the Select construction and its cache key, so per request only
+# the two parameters are bound.
+draft_lookup_stmt = lambda_stmt(
+    lambda: select(DraftResponseModel).where(
+        DraftResponseModel.id == bindparam("draft_id"),
+        DraftResponseModel.opportunity_id == bindparam("opportunity_id"),
+    )
+)
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -25,6 +25,25 @@ from talent_inbound.modules.opportunities.infrastructure.orm_models import (
     OpportunityModel,
     StageTransitionModel,
 )
+from talent_inbound.shared.domain.enums import OpportunityStage
+from talent_inbound.shared.infrastructure.database import is_uuid
+
+# stage is a native enum column: unknown values would raise in the driver.
+_STAGE_VALUES = frozenset(OpportunityStage)
+
+# Whitespace trimmed from extracted fields (str.strip() equivalent for ASCII)
+_TRIM_CHARS = " \t\n\r\f\v"
+# PostgreSQL ARE metacharacters, escaped so stored names match literally
+_REGEX_META = r"([.^$*+?()\[\]{}|\\])"
+
+
+def _whole_word_pattern(column):
+    r"""Regex matching the column's trimmed, lowercased value as a whole word
+    (\y...\y, PostgreSQL's equivalent of re's \b...\b)."""
+    escaped = func.regexp_replace(
+        func.lower(func.btrim(column, _TRIM_CHARS)), _REGEX_META, r"\\\1", "g"
+    )
+    return literal(r"\y") + escaped + literal(r"\y")
 
 
 class SqlAlchemyOpportunityRepository(OpportunityRepository):
@@ -37,13 +56,13 @@ class SqlAlchemyOpportunityRepository(OpportunityRepository):
         model = OpportunityModel.from_domain(opportunity)
         self._session.add(model)
         await self._session.flush()
-        await self._session.refresh(model)
         return model.to_domain()
 
     async def find_by_id(self, opportunity_id: str) -> Opportunity | None:
-        stmt = select(OpportunityModel).where(OpportunityModel.id == opportunity_id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        if not is_uuid(opportunity_id):
+            return None
+        # PK lookup: served from the identity map when already loaded
+        model = await self._session.get(OpportunityModel, opportunity_id)
         return model.to_domain() if model else None
 
     async def list_by_candidate(
@@ -63,16 +82,59 @@ class SqlAlchemyOpportunityRepository(OpportunityRepository):
             # Default: non-archived only
             stmt = stmt.where(OpportunityModel.is_archived == False)  # noqa: E712
         if stage_filter:
+            if stage_filter not in _STAGE_VALUES:
+                return []
             stmt = stmt.where(OpportunityModel.stage == stage_filter)
         stmt = stmt.order_by(OpportunityModel.created_at.desc())
         result = await self._session.execute(stmt)
         models = result.scalars().all()
         return [m.to_domain() for m in models]
 
-    async def update(self, opportunity: Opportunity) -> Opportunity:
-        stmt = select(OpportunityModel).where(OpportunityModel.id == opportunity.id)
+    async def find_field_duplicate(
+        self, candidate_id: str, content: str
+    ) -> str | None:
+        # Lowercased once here, not by lower() per candidate row
+        content_lower = literal(content.lower())
+        stmt = (
+            select(OpportunityModel.id)
+            .where(OpportunityModel.candidate_id == candidate_id)
+            .where(OpportunityModel.is_archived == False)  # noqa: E712
+            # btrim(NULL) is NULL, so this also skips unextracted fields
+            .where(func.btrim(OpportunityModel.company_name, _TRIM_CHARS) != "")
+            .where(func.btrim(OpportunityModel.role_title, _TRIM_CHARS) != "")
+            .where(
+                content_lower.regexp_match(
+                    _whole_word_pattern(OpportunityModel.company_name)
+                )
+            )
+            .where(
+                content_lower.regexp_match(
+                    _whole_word_pattern(OpportunityModel.role_title)
+                )
+            )
+            .order_by(OpportunityModel.created_at.desc())
+            .limit(1)
+        )
         result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        return result.scalar_one_or_none()
+
+    async def update(self, opportunity: Opportunity) -> Opportunity:
+        model = await self._apply(opportunity)
+        await self._session.flush()
+        return model.to_domain()
+
+    async def update_with_transition(
+        self, opportunity: Opportunity, transition: StageTransition
+    ) -> Opportunity:
+        model = await self._apply(opportunity)
+        self._session.add(StageTransitionModel.from_domain(transition))
+        await self._session.flush()  # UPDATE + INSERT in one flush
+        return model.to_domain()
+
+    async def _apply(self, opportunity: Opportunity) -> OpportunityModel:
+        """Copy the entity onto its loaded row; the caller flushes."""
+        # Usually loaded by find_by_id earlier in the request: no SELECT
+        model = await self._session.get(OpportunityModel, opportunity.id)
         if model is None:
             raise ValueError(f"Opportunity not found: {opportunity.id}")
 
@@ -94,16 +156,10 @@ class SqlAlchemyOpportunityRepository(OpportunityRepository):
         model.suggested_stage_reason = opportunity.suggested_stage_reason
         model.is_archived = opportunity.is_archived
         model.last_interaction_at = opportunity.last_interaction_at
-        await self._session.flush()
-        await self._session.refresh(model)
-        return model.to_domain()
+        return model
 
     async def delete(self, opportunity_id: str) -> None:
-        stmt = select(OpportunityModel).where(
-            OpportunityModel.id == opportunity_id
-        )
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        model = await self._session.get(OpportunityModel, opportunity_id)
         if model is None:
             raise ValueError(f"Opportunity not found: {opportunity_id}")
         await self._session.delete(model)
@@ -113,7 +169,6 @@ class SqlAlchemyOpportunityRepository(OpportunityRepository):
         model = StageTransitionModel.from_domain(transition)
         self._session.add(model)
         await self._session.flush()
-        await self._session.refresh(model)
         return model.to_domain()
 
     async def list_transitions(self, opportunity_id: str) -> list[StageTransition]:
@@ -2,13 +2,16 @@
 
 from datetime import UTC, datetime
 
+import structlog
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 
+from talent_inbound.config import Settings
 from talent_inbound.container import Container
 from talent_inbound.modules.auth.domain.entities import User
 from talent_inbound.modules.auth.presentation.dependencies import get_current_user
+from talent_inbound.modules.ingestion.infrastructure.orm_models import InteractionModel
 from talent_inbound.modules.opportunities.application.archive import (
     ArchiveOpportunity,
     UnarchiveOpportunity,
@@ -36,6 +39,10 @@ from talent_inbound.modules.opportunities.domain.exceptions import (
 from talent_inbound.modules.opportunities.domain.repositories import (
     OpportunityRepository,
 )
+from talent_inbound.modules.opportunities.infrastructure.orm_models import (
+    DraftResponseModel,
+    draft_lookup_stmt,
+)
 from talent_inbound.modules.opportunities.presentation.schemas import (
     AcceptStageSuggestionResponse,
     ArchiveResponse,
@@ -54,7 +61,14 @@ from talent_inbound.modules.opportunities.presentation.schemas import (
     SubmitFollowUpRequest,
     SubmitFollowUpResponse,
 )
+from talent_inbound.modules.pipeline.application.process_pipeline import ProcessPipeline
+from talent_inbound.modules.pipeline.infrastructure.graphs import (
+    build_followup_pipeline,
+)
 from talent_inbound.shared.domain.enums import TransitionTrigger
+from talent_inbound.shared.infrastructure.database import get_current_session, is_uuid
+
+logger = structlog.get_logger()
 
 router = APIRouter(prefix="/opportunities", tags=["opportunities"])
 
@@ -147,11 +161,6 @@ async def get_opportunity_detail(
     transitions = await opportunity_repo.list_transitions(opportunity_id)
 
     # Load interactions for this opportunity
-    from talent_inbound.modules.ingestion.infrastructure.orm_models import (
-        InteractionModel,
-    )
-    from talent_inbound.shared.infrastructure.database import get_current_session
-
     session = get_current_session()
     stmt = (
         select(InteractionModel)
@@ -193,10 +202,6 @@ async def get_opportunity_detail(
     ]
 
     # Load draft responses
-    from talent_inbound.modules.opportunities.infrastructure.orm_models import (
-        DraftResponseModel,
-    )
-
     draft_stmt = (
         select(DraftResponseModel)
         .where(DraftResponseModel.opportunity_id == opportunity_id)
@@ -326,9 +331,10 @@ async def accept_stage_suggestion(
         raise HTTPException(status_code=400, detail="No stage suggestion to accept")
 
     transition = opp.accept_stage_suggestion()
-    await opportunity_repo.update(opp)
     if transition:
-        await opportunity_repo.save_transition(transition)
+        await opportunity_repo.update_with_transition(opp, transition)
+    else:
+        await opportunity_repo.update(opp)
 
     transition_item = None
     if transition:
@@ -492,6 +498,9 @@ async def edit_draft(
     if opp is None or opp.candidate_id != current_user.id:
         raise HTTPException(status_code=404, detail="Opportunity not found")
 
+    if not is_uuid(draft_id):
+        raise HTTPException(status_code=400, detail="Draft not found")
+
     try:
         result = await edit_draft_uc.execute(
             opportunity_id=opportunity_id,
@@ -522,17 +531,13 @@ async def delete_draft(
     if opp is None or opp.candidate_id != current_user.id:
         raise HTTPException(status_code=404, detail="Opportunity not found")
 
-    from talent_inbound.modules.opportunities.infrastructure.orm_models import (
-        DraftResponseModel,
-    )
-    from talent_inbound.shared.infrastructure.database import get_current_session
+    if not is_uuid(draft_id):
+        raise HTTPException(status_code=404, detail="Draft not found")
 
     session = get_current_session()
-    stmt = select(DraftResponseModel).where(
-        DraftResponseModel.id == draft_id,
-        DraftResponseModel.opportunity_id == opportunity_id,
+    result = await session.execute(
+        draft_lookup_stmt, {"draft_id": draft_id, "opportunity_id": opportunity_id}
     )
-    result = await session.execute(stmt)
     draft_model = result.scalar_one_or_none()
     if draft_model is None:
         raise HTTPException(status_code=404, detail="Draft not found")
@@ -559,6 +564,9 @@ async def confirm_draft_sent(
     if opp is None or opp.candidate_id != current_user.id:
         raise HTTPException(status_code=404, detail="Opportunity not found")
 
+    if not is_uuid(draft_id):
+        raise HTTPException(status_code=400, detail="Draft not found")
+
     try:
         result = await confirm_sent_uc.execute(
             opportunity_id=opportunity_id,
@@ -588,7 +596,11 @@ async def submit_followup(
     interaction_repo=Depends(Provide[Container.interaction_repo]),
     model_router=Depends(Provide[Container.model_router]),
     sse_emitter=Depends(Provide[Container.sse_emitter]),
+    settings: Settings = Depends(Provide[Container.config]),
 ) -> SubmitFollowUpResponse:
+    if not is_uuid(opportunity_id):
+        raise HTTPException(status_code=400, detail="Opportunity not found")
+
     try:
         result = await submit_followup_uc.execute(
             opportunity_id=opportunity_id,
@@ -600,35 +612,13 @@ async def submit_followup(
         raise HTTPException(status_code=400, detail=str(e))
 
     # Run follow-up pipeline inline
-    import structlog
-
-    from talent_inbound.container import Container as C
-    from talent_inbound.modules.pipeline.application.process_pipeline import (
-        ProcessPipeline,
-    )
-    from talent_inbound.modules.pipeline.infrastructure.graphs import (
-        build_followup_pipeline,
-    )
-
-    logger = structlog.get_logger()
     try:
-        from talent_inbound.config import get_settings as _gs
-
-        _settings = _gs()
-        scoring_weights = {
-            "base": _settings.scoring_base,
-            "skills": _settings.scoring_skills_weight,
-            "wm_match": _settings.scoring_work_model_match,
-            "wm_mismatch": _settings.scoring_work_model_mismatch,
-            "sal_meets": _settings.scoring_salary_meets_min,
-            "sal_below": _settings.scoring_salary_below_min,
-        }
-        opp_repo = C.opportunity_repo()
-        profile_repo = C.profile_repo()
+        opp_repo = Container.opportunity_repo()
+        profile_repo = Container.profile_repo()
         graph = build_followup_pipeline(
             model_router,
             profile_repo=profile_repo,
-            scoring_weights=scoring_weights,
+            scoring_weights=settings.scoring_weights,
             opportunity_repo=opp_repo,
         )
         pipeline_uc = ProcessPipeline(
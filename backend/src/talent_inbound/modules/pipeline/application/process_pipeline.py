@@ -36,14 +36,16 @@ class ProcessPipeline:
         self._graph = pipeline_graph
         self._sse = sse_emitter
 
-    async def execute(self, interaction_id: str) -> None:
+    async def execute(self, interaction_id: str) -> str | None:
+        """Run the pipeline; return the opportunity's final stage value, or
+        None when no opportunity was updated."""
         log = logger.bind(interaction_id=interaction_id)
 
         # Load interaction
         interaction = await self._interaction_repo.find_by_id(interaction_id)
         if interaction is None:
             log.error("interaction_not_found")
-            return
+            return None
 
         opportunity_id = interaction.opportunity_id or ""
         log = log.bind(opportunity_id=opportunity_id)
@@ -138,11 +140,12 @@ class ProcessPipeline:
                         classification=classification_str,
                         final_stage=stage_value,
                     )
-                    return
+                    return stage_value
 
             # No opportunity to update — just emit complete
             await self._sse.emit_complete(interaction_id, opportunity_id, "DISCOVERY")
             log.info("pipeline_completed", classification=classification_str)
+            return None
 
         except Exception:
             log.exception("pipeline_failed")
@@ -150,6 +153,7 @@ class ProcessPipeline:
             await self._interaction_repo.update(interaction)
 
             # Update opportunity stage so it doesn't stay stuck
+            failed_stage = None
             if opportunity_id:
                 opportunity = await self._opportunity_repo.find_by_id(opportunity_id)
                 if opportunity:
@@ -159,8 +163,10 @@ class ProcessPipeline:
                         note="Pipeline failed — manual review needed",
                     )
                     await self._opportunity_repo.update(opportunity)
+                    failed_stage = opportunity.stage.value
 
             await self._sse.emit_complete(interaction_id, opportunity_id, "DISCOVERY")
+            return failed_stage
 
     def _determine_stage(self, result: dict) -> OpportunityStage:
         """Determine the opportunity stage based on pipeline results."""
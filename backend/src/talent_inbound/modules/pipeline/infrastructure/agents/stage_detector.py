@@ -16,7 +16,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from talent_inbound.modules.pipeline.domain.state import PipelineState, StepLog
 from talent_inbound.modules.pipeline.prompts import load_prompt
-from talent_inbound.shared.domain.enums import STAGE_FLOW, OpportunityStage
+from talent_inbound.shared.domain.enums import STAGE_INDEX, OpportunityStage
 
 logger = structlog.get_logger()
 
@@ -52,10 +52,10 @@ def _is_forward_move(current_stage: str, suggested_stage: str) -> bool:
     except ValueError:
         return False
 
-    if current not in STAGE_FLOW or suggested not in STAGE_FLOW:
+    if current not in STAGE_INDEX or suggested not in STAGE_INDEX:
         return False
 
-    return STAGE_FLOW.index(suggested) > STAGE_FLOW.index(current)
+    return STAGE_INDEX[suggested] > STAGE_INDEX[current]
 
 
 def _heuristic_detect(text: str, current_stage: str) -> tuple[str | None, str | None]:
@@ -1,10 +1,18 @@
 """SQLAlchemy ORM model for the CandidateProfile entity."""
 
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import (
+    DateTime,
+    FetchedValue,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from talent_inbound.modules.profile.domain.entities import CandidateProfile
@@ -17,10 +25,10 @@ class CandidateProfileModel(Base):
     __tablename__ = "candidate_profiles"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     candidate_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("users.id", ondelete="CASCADE"),
         unique=True,
         nullable=False,
@@ -46,15 +54,13 @@ class CandidateProfileModel(Base):
     follow_up_days: Mapped[int] = mapped_column(Integer, nullable=False, default=7)
     ghosting_days: Mapped[int] = mapped_column(Integer, nullable=False, default=14)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        nullable=False,
-        default=lambda: datetime.now(UTC),
+        DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # set_updated_at trigger
     )
 
     def to_domain(self) -> CandidateProfile:
@@ -20,7 +20,6 @@ class SqlAlchemyProfileRepository(ProfileRepository):
         model = CandidateProfileModel.from_domain(profile)
         self._session.add(model)
         await self._session.flush()
-        await self._session.refresh(model)
         return model.to_domain()
 
     async def find_by_candidate_id(self, candidate_id: str) -> CandidateProfile | None:
@@ -32,11 +31,7 @@ class SqlAlchemyProfileRepository(ProfileRepository):
         return model.to_domain() if model else None
 
     async def update(self, profile: CandidateProfile) -> CandidateProfile:
-        stmt = select(CandidateProfileModel).where(
-            CandidateProfileModel.id == profile.id
-        )
-        result = await self._session.execute(stmt)
-        model = result.scalar_one()
+        model = await self._session.get_one(CandidateProfileModel, profile.id)
 
         model.display_name = profile.display_name
         model.professional_title = profile.professional_title
@@ -53,5 +48,4 @@ class SqlAlchemyProfileRepository(ProfileRepository):
         model.ghosting_days = profile.ghosting_days
 
         await self._session.flush()
-        await self._session.refresh(model)
         return model.to_domain()
@@ -0,0 +1,17 @@
+"""Import every module's ORM models so they register on Base.metadata.
+
+Alembic autogenerate imports this one module instead of listing each
+module's orm_models by hand; new modules are picked up automatically.
+Only packages and ``orm_models`` modules are imported, never the DI container.
+"""
+
+import importlib
+import pkgutil
+
+import talent_inbound.modules
+
+for _module in pkgutil.walk_packages(
+    talent_inbound.modules.__path__, prefix="talent_inbound.modules."
+):
+    if _module.name.endswith(".infrastructure.orm_models"):
+        importlib.import_module(_module.name)
@@ -14,6 +14,8 @@ class OpportunityStage(StrEnum):
     GHOSTED = "GHOSTED"
 
 
+# StrEnum members hash and compare as their values, so raw ORM stage strings
+# can be tested for membership without an OpportunityStage(...) lookup.
 TERMINAL_STAGES = frozenset(
     {
         OpportunityStage.OFFER,
@@ -30,6 +32,9 @@ STAGE_FLOW = [
     OpportunityStage.NEGOTIATING,
 ]
 
+# Position of each stage in STAGE_FLOW: O(1) membership and ordering checks
+STAGE_INDEX = {stage: i for i, stage in enumerate(STAGE_FLOW)}
+
 
 class InteractionSource(StrEnum):
     LINKEDIN = "LINKEDIN"
@@ -1,7 +1,8 @@
 """Database engine, session factory, declarative base, and per-request session middleware."""
 
+import uuid
 from contextvars import ContextVar
-from typing import Any
+from typing import Any, ClassVar
 
 import structlog
 from sqlalchemy.exc import OperationalError
@@ -23,9 +24,38 @@ _current_session: ContextVar[AsyncSession | None] = ContextVar(
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base for all ORM models."""
 
-
-def create_engine(database_url: str, echo: bool = False):
-    return create_async_engine(database_url, echo=echo, future=True)
+    # Fetch server-generated created_at/updated_at via RETURNING on flush,
+    # instead of expiring them (an expired attribute can't lazy-load on async).
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
+
+
+def create_engine(
+    database_url: str,
+    echo: bool = False,
+    *,
+    pool_size: int = 20,
+    max_overflow: int = 10,
+    pool_recycle: int = 1800,
+    pool_pre_ping: bool = False,
+    pool_use_lifo: bool = True,
+    query_cache_size: int = 1200,
+):
+    """Create the async engine.
+
+    LIFO checkout keeps reusing the most recently returned connections, so idle
+    ones age out of the pool under light traffic instead of being kept warm.
+    """
+    return create_async_engine(
+        database_url,
+        echo=echo,
+        future=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        pool_use_lifo=pool_use_lifo,
+        query_cache_size=query_cache_size,
+    )
 
 
 def create_session_factory(engine) -> async_sessionmaker[AsyncSession]:
@@ -36,6 +66,19 @@ def create_session_factory(engine) -> async_sessionmaker[AsyncSession]:
     )
 
 
+def is_uuid(value: str) -> bool:
+    """True if value is a well-formed UUID.
+
+    ID columns are native uuid, so the driver rejects malformed values with
+    a DataError. Lookups use this to treat such IDs as "not found" instead.
+    """
+    try:
+        uuid.UUID(value)
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return True
+
+
 def get_current_session() -> AsyncSession:
     """Retrieve the per-request DB session from the ContextVar.
 
@@ -1,9 +1,15 @@
 """Structured logging configuration using structlog."""
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 
+# Started once per process; drains records to stderr on its own thread.
+_listener: QueueListener | None = None
+
 
 def configure_logging(log_level: str = "INFO", json_output: bool = True) -> None:
     shared_processors: list[structlog.types.Processor] = [
@@ -28,10 +34,20 @@ def configure_logging(log_level: str = "INFO", json_output: bool = True) -> None
         cache_logger_on_first_use=True,
     )
 
-    logging.basicConfig(
-        format="%(message)s",
-        level=getattr(logging, log_level.upper(), logging.INFO),
-    )
+    # Like basicConfig: only when nothing else (e.g. pytest) owns the root
+    # logger. Rendering still happens in the caller; only the stream write
+    # moves to the listener thread, so a slow stderr/pipe never stalls a request.
+    global _listener
+    root = logging.getLogger()
+    if _listener is None and not root.handlers:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        root.addHandler(QueueHandler(log_queue))
+        root.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)  # flush queued records on shutdown
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
@@ -3,7 +3,7 @@
 import time
 import uuid
 
-from jose import jwt as jose_jwt
+import jwt
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
@@ -26,7 +26,7 @@ def _extract_user_email(request: Request) -> str | None:
     try:
         # Decode without verification — we only need the email for logging.
         # Auth verification happens in the dependency layer.
-        payload = jose_jwt.get_unverified_claims(token)
+        payload = jwt.decode(token, options={"verify_signature": False})
         return payload.get("email")
     except Exception:
         return None
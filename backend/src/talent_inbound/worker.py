@@ -39,7 +39,14 @@ async def process_pipeline(ctx: dict, interaction_id: str) -> None:
     log.info("pipeline_job_started")
 
     # Create a dedicated DB session for this job (worker runs outside HTTP context)
-    engine = create_engine(settings.database_url)
+    engine = create_engine(
+        settings.database_url,
+        echo=False,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_use_lifo=settings.db_pool_use_lifo,
+        query_cache_size=settings.db_query_cache_size,
+    )
     factory = create_session_factory(engine)
 
     async with factory() as session:
@@ -68,9 +68,11 @@ def _create_test_app():
     # Override DATABASE_URL so Settings picks up the test DB
     os.environ["DATABASE_URL"] = _TEST_DB_URL
 
-    # Clear cached settings so it re-reads with test DB URL
+    # Clear cached settings/container so they re-read with test DB URL
     from talent_inbound.config import get_settings as _gs
+    from talent_inbound.container import get_container as _gc
     _gs.cache_clear()
+    _gc.cache_clear()
 
     from talent_inbound.main import create_app
     app = create_app()
@@ -0,0 +1,81 @@
+"""Unit tests for the GetCurrentUser use case."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import jwt
+import pytest
+
+from talent_inbound.modules.auth.application.get_current_user import GetCurrentUser
+from talent_inbound.modules.auth.domain.entities import User
+from talent_inbound.modules.auth.domain.exceptions import InvalidCredentialsError
+from talent_inbound.modules.auth.infrastructure.token_cache import AccessTokenCache
+
+JWT_SECRET = "test-secret-key-for-unit-tests-hs256"
+
+
+def _token(user_id: str, token_type: str = "access") -> str:
+    now = datetime.now(UTC)
+    return jwt.encode(
+        {"sub": user_id, "type": token_type, "exp": now + timedelta(minutes=5)},
+        JWT_SECRET,
+        algorithm="HS256",
+    )
+
+
+@pytest.fixture
+def user() -> User:
+    return User(email="user@example.com", hashed_password="hash")
+
+
+@pytest.fixture
+def user_repo(user: User) -> AsyncMock:
+    repo = AsyncMock()
+    repo.find_by_id = AsyncMock(return_value=user)
+    return repo
+
+
+class TestGetCurrentUser:
+
+    async def test_returns_user_for_valid_token(
+        self, user: User, user_repo: AsyncMock
+    ) -> None:
+        uc = GetCurrentUser(user_repo=user_repo, jwt_secret=JWT_SECRET)
+        assert await uc.execute(_token(user.id)) is user
+        user_repo.find_by_id.assert_awaited_once_with(user.id)
+
+    async def test_rejects_refresh_token(
+        self, user: User, user_repo: AsyncMock
+    ) -> None:
+        uc = GetCurrentUser(user_repo=user_repo, jwt_secret=JWT_SECRET)
+        with pytest.raises(InvalidCredentialsError):
+            await uc.execute(_token(user.id, token_type="refresh"))
+
+    async def test_cached_token_skips_decode_but_reloads_user(
+        self, user: User, user_repo: AsyncMock
+    ) -> None:
+        uc = GetCurrentUser(
+            user_repo=user_repo, jwt_secret=JWT_SECRET, token_cache=AccessTokenCache()
+        )
+        token = _token(user.id)
+        await uc.execute(token)
+
+        with patch(
+            "talent_inbound.modules.auth.application.get_current_user.jwt.decode"
+        ) as decode:
+            assert await uc.execute(token) is user
+        decode.assert_not_called()
+        assert user_repo.find_by_id.await_count == 2
+
+    async def test_cached_token_still_rejects_inactive_user(
+        self, user: User, user_repo: AsyncMock
+    ) -> None:
+        uc = GetCurrentUser(
+            user_repo=user_repo, jwt_secret=JWT_SECRET, token_cache=AccessTokenCache()
+        )
+        token = _token(user.id)
+        await uc.execute(token)
+
+        user.is_active = False
+        with pytest.raises(InvalidCredentialsError):
+            await uc.execute(token)
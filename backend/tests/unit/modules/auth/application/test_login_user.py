@@ -2,8 +2,8 @@
 
 from unittest.mock import AsyncMock
 
+import jwt
 import pytest
-from jose import jwt
 
 from talent_inbound.modules.auth.application.login_user import (
     LoginUser,
@@ -16,7 +16,7 @@ from talent_inbound.modules.auth.domain.exceptions import (
 )
 from talent_inbound.modules.auth.infrastructure.password import BcryptPasswordHasher
 
-JWT_SECRET = "test-secret-key-for-unit-tests"
+JWT_SECRET = "test-secret-key-for-unit-tests-hs256"
 
 
 @pytest.fixture
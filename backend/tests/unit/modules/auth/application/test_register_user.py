@@ -8,7 +8,6 @@ from talent_inbound.modules.auth.application.register_user import (
     RegisterUser,
     RegisterUserCommand,
 )
-from talent_inbound.modules.auth.domain.entities import User
 from talent_inbound.modules.auth.domain.exceptions import DuplicateEmailError
 from talent_inbound.modules.auth.infrastructure.password import BcryptPasswordHasher
 
@@ -16,8 +15,7 @@ from talent_inbound.modules.auth.infrastructure.password import BcryptPasswordHa
 @pytest.fixture
 def mock_user_repo() -> AsyncMock:
     repo = AsyncMock()
-    repo.find_by_email = AsyncMock(return_value=None)
-    repo.save = AsyncMock(side_effect=lambda user: user)
+    repo.insert_if_unique = AsyncMock(side_effect=lambda user: user)
     return repo
 
 
@@ -58,7 +56,7 @@ class TestRegisterUser:
 
         assert user.email == "new@example.com"
         assert user.hashed_password != "Str0ngPass1"  # Must be hashed
-        mock_user_repo.save.assert_called_once()
+        mock_user_repo.insert_if_unique.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_register_publishes_user_registered_event(
@@ -75,13 +73,28 @@ class TestRegisterUser:
         register_uc: RegisterUser,
         mock_user_repo: AsyncMock,
     ) -> None:
-        existing_user = User(email="dupe@example.com", hashed_password="hash")
-        mock_user_repo.find_by_email.return_value = existing_user
+        mock_user_repo.insert_if_unique.side_effect = None
+        mock_user_repo.insert_if_unique.return_value = None
 
         cmd = RegisterUserCommand(email="dupe@example.com", password="Str0ngPass1")
         with pytest.raises(DuplicateEmailError):
             await register_uc.execute(cmd)
 
+    @pytest.mark.asyncio
+    async def test_register_duplicate_email_publishes_no_event(
+        self,
+        register_uc: RegisterUser,
+        mock_user_repo: AsyncMock,
+        mock_event_bus: AsyncMock,
+    ) -> None:
+        mock_user_repo.insert_if_unique.side_effect = None
+        mock_user_repo.insert_if_unique.return_value = None
+
+        cmd = RegisterUserCommand(email="dupe@example.com", password="Str0ngPass1")
+        with pytest.raises(DuplicateEmailError):
+            await register_uc.execute(cmd)
+        mock_event_bus.publish_all.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_register_hashes_password(
         self,
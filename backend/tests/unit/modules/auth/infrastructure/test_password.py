@@ -0,0 +1,23 @@
+"""Unit tests for the bcrypt password hasher."""
+
+from talent_inbound.modules.auth.infrastructure.password import BcryptPasswordHasher
+
+
+class TestBcryptPasswordHasher:
+    """Tests for BcryptPasswordHasher."""
+
+    def test_hash_uses_configured_rounds(self) -> None:
+        hasher = BcryptPasswordHasher(rounds=4)
+        assert hasher.hash("SecurePass1").startswith("$2b$04$")
+
+    def test_verify_accepts_hash_from_other_rounds(self) -> None:
+        hashed = BcryptPasswordHasher(rounds=5).hash("SecurePass1")
+        hasher = BcryptPasswordHasher(rounds=4)
+        assert hasher.verify("SecurePass1", hashed)
+        assert not hasher.verify("WrongPass1", hashed)
+
+    async def test_async_variants_round_trip(self) -> None:
+        hasher = BcryptPasswordHasher(rounds=4)
+        hashed = await hasher.hash_async("SecurePass1")
+        assert await hasher.verify_async("SecurePass1", hashed)
+        assert not await hasher.verify_async("WrongPass1", hashed)
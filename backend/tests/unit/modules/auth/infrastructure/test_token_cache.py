@@ -0,0 +1,31 @@
+"""Unit tests for the access-token claims cache."""
+
+import time
+
+from talent_inbound.modules.auth.infrastructure.token_cache import AccessTokenCache
+
+
+class TestAccessTokenCache:
+    """Tests for AccessTokenCache."""
+
+    def test_returns_cached_user_id(self) -> None:
+        cache = AccessTokenCache()
+        cache.put("token-a", "user-1", time.time() + 60)
+        assert cache.get("token-a") == "user-1"
+        assert cache.get("token-b") is None
+
+    def test_expired_entry_is_dropped(self) -> None:
+        cache = AccessTokenCache()
+        cache.put("token-a", "user-1", time.time() - 1)
+        assert cache.get("token-a") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = AccessTokenCache(maxsize=2)
+        exp = time.time() + 60
+        cache.put("token-a", "user-1", exp)
+        cache.put("token-b", "user-2", exp)
+        cache.get("token-a")  # token-b is now least recently used
+        cache.put("token-c", "user-3", exp)
+        assert cache.get("token-a") == "user-1"
+        assert cache.get("token-b") is None
+        assert cache.get("token-c") == "user-3"
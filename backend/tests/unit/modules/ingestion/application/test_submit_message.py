@@ -8,7 +8,6 @@ from talent_inbound.modules.ingestion.application.submit_message import (
     SubmitMessage,
     SubmitMessageCommand,
 )
-from talent_inbound.modules.ingestion.domain.entities import Interaction
 from talent_inbound.modules.ingestion.domain.exceptions import (
     ContentTooLongError,
     DuplicateInteractionError,
@@ -28,12 +27,14 @@ class TestSubmitMessage:
     @pytest.fixture
     def mock_interaction_repo(self):
         repo = AsyncMock()
-        repo.find_duplicate.return_value = None
+        repo.find_duplicate_opportunity_id.return_value = None
         return repo
 
     @pytest.fixture
     def mock_opportunity_repo(self):
-        return AsyncMock()
+        repo = AsyncMock()
+        repo.find_field_duplicate.return_value = None
+        return repo
 
     @pytest.fixture
     def mock_event_bus(self):
@@ -125,13 +126,9 @@ class TestSubmitMessage:
     async def test_submit_detects_duplicates(
         self, use_case, mock_interaction_repo
     ):
-        existing = Interaction(
-            candidate_id="user-1",
-            raw_content="Duplicate message",
-            source=InteractionSource.LINKEDIN,
-            opportunity_id="existing-opp",
+        mock_interaction_repo.find_duplicate_opportunity_id.return_value = (
+            "existing-opp"
         )
-        mock_interaction_repo.find_duplicate.return_value = existing
 
         with pytest.raises(DuplicateInteractionError) as exc_info:
             await use_case.execute(
@@ -143,6 +140,25 @@ class TestSubmitMessage:
             )
         assert exc_info.value.existing_opportunity_id == "existing-opp"
 
+    async def test_submit_detects_field_based_duplicates(
+        self, use_case, mock_opportunity_repo
+    ):
+        mock_opportunity_repo.find_field_duplicate.return_value = "similar-opp"
+
+        with pytest.raises(DuplicateInteractionError) as exc_info:
+            await use_case.execute(
+                SubmitMessageCommand(
+                    candidate_id="user-1",
+                    raw_content="  Senior Backend role at Acme Corp, reworded  ",
+                    source="LINKEDIN",
+                )
+            )
+        assert exc_info.value.existing_opportunity_id == "similar-opp"
+        mock_opportunity_repo.find_field_duplicate.assert_awaited_once_with(
+            "user-1", "Senior Backend role at Acme Corp, reworded"
+        )
+        mock_opportunity_repo.save.assert_not_called()
+
     async def test_submit_with_all_sources(
         self, use_case, mock_interaction_repo, mock_opportunity_repo
     ):
@@ -161,6 +177,6 @@ class TestSubmitMessage:
             # Reset mocks for next iteration
             mock_interaction_repo.reset_mock()
             mock_opportunity_repo.reset_mock()
-            mock_interaction_repo.find_duplicate.return_value = None
+            mock_interaction_repo.find_duplicate_opportunity_id.return_value = None
             mock_interaction_repo.save.side_effect = lambda i: i
             mock_opportunity_repo.save.side_effect = lambda o: o
@@ -57,6 +57,24 @@ class TestInteractionEntity:
         )
         assert i1.content_hash == i2.content_hash
 
+    def test_content_hash_is_raw_sha256_digest(self):
+        interaction = Interaction(
+            candidate_id="u1",
+            raw_content="Hello recruiter",
+            source=InteractionSource.LINKEDIN,
+        )
+        assert isinstance(interaction.content_hash, bytes)
+        assert len(interaction.content_hash) == 32
+
+    def test_content_hash_computed_once(self):
+        interaction = Interaction(
+            candidate_id="u1",
+            raw_content="Hello recruiter",
+            source=InteractionSource.LINKEDIN,
+        )
+        assert interaction.content_hash is interaction.content_hash
+        assert "content_hash" not in interaction.model_dump()
+
     def test_content_hash_differs_by_source(self):
         i1 = Interaction(
             candidate_id="u1",
@@ -27,8 +27,7 @@ def _make_opp(**overrides) -> Opportunity:
 def _make_repo(opportunity: Opportunity | None):
     repo = AsyncMock()
     repo.find_by_id.return_value = opportunity
-    repo.update.return_value = opportunity
-    repo.save_transition.side_effect = lambda t: t
+    repo.update_with_transition.return_value = opportunity
     return repo
 
 
@@ -48,8 +47,9 @@ class TestChangeStage:
         assert transition.to_stage == OpportunityStage.ENGAGING
         assert transition.is_unusual is False
         assert transition.triggered_by == TransitionTrigger.USER
-        repo.update.assert_awaited_once()
-        repo.save_transition.assert_awaited_once()
+        repo.update_with_transition.assert_awaited_once_with(opp, transition)
+        repo.update.assert_not_awaited()
+        repo.save_transition.assert_not_awaited()
 
     async def test_unusual_skip_transition(self):
         opp = _make_opp(stage=OpportunityStage.DISCOVERY)
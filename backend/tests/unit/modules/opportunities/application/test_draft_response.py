@@ -14,6 +14,7 @@ from talent_inbound.modules.opportunities.domain.exceptions import (
 
 # Patch targets — must match the module where the symbol is looked up at runtime.
 _EDIT_DRAFT_SESSION = "talent_inbound.modules.opportunities.application.edit_draft.get_current_session"
+_GENERATE_DRAFT = "talent_inbound.modules.opportunities.application.generate_draft"
 
 
 def _make_opportunity(opp_id="opp-1", candidate_id="cand-1"):
@@ -60,27 +61,23 @@ class TestGenerateDraft:
         uc = GenerateDraft(opportunity_repo=repo, model_router=None)
 
         for rt in ("REQUEST_INFO", "EXPRESS_INTEREST", "DECLINE"):
-            # The late imports inside execute() need patching at the source
             mock_session = AsyncMock()
-            mock_model = MagicMock()
-            mock_model.id = "draft-1"
-            mock_model.response_type = rt
-            mock_model.generated_content = "Draft text"
-            mock_model.edited_content = None
-            mock_model.is_final = False
-            mock_model.created_at = "2026-01-01T00:00:00Z"
+            mock_row = MagicMock()
+            mock_row.id = "draft-1"
+            mock_row.is_final = False
+            mock_row.is_sent = False
+            mock_row.created_at = "2026-01-01T00:00:00Z"
+            mock_session.execute.return_value.one = MagicMock(return_value=mock_row)
 
             with patch(
-                "talent_inbound.shared.infrastructure.database.get_current_session",
+                f"{_GENERATE_DRAFT}.get_current_session",
                 return_value=mock_session,
-            ), patch(
-                "talent_inbound.modules.opportunities.infrastructure.orm_models.DraftResponseModel",
-                return_value=mock_model,
             ):
-                mock_session.refresh = AsyncMock()
                 result = await uc.execute("opp-1", rt)
 
             assert result["response_type"] == rt
+            assert result["id"] == "draft-1"
+            mock_session.execute.assert_awaited()
 
 
 class TestEditDraft: